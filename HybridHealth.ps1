@@ -10,15 +10,7 @@ $SrcDir    = Join-Path $Project "src"
 $FetchPy   = Join-Path $SrcDir "fetch_nflverse.py"
 $RebuildPy = Join-Path $SrcDir "rebuild_support_exports.py"
 
-# Data files we expect after a successful fetch/rebuild
-$ExpectCsv = @(
-  "players_weekly.csv",        # your unified weekly file
-  "player_weekly.csv",         # alt name some pipelines produce
-  "espn_player_weekly.csv",
-  "weekly_stats.csv"           # fallback if you keep a combined weekly
-) | ForEach-Object { Join-Path $SyncDir $_ }
-
-# Treat files older than this as stale and trigger a refresh
+# Treat outputs fetched longer ago than this as stale and trigger a refresh
 $StaleDays = 7
 
 # ===== UTIL =====
@@ -57,16 +49,11 @@ function Ensure-PyPkg($pyExe, $pkg){
 }
 
 function Needs-FetchOrRebuild{
-  # true if any expected CSV missing or all are older than $StaleDays
-  $existing = $ExpectCsv | Where-Object { Test-Path $_ }
-  if ($existing.Count -eq 0) { return $true }
-  $cutoff = (Get-Date).AddDays(-$StaleDays)
-  $allOld = $true
-  foreach($f in $existing){
-    $lt = (Get-Item $f).LastWriteTime
-    if ($lt -gt $cutoff) { $allOld = $false }
-  }
-  return $allOld
+  # Ask the freshness index (content hash + fetch time per output) rather than
+  # LastWriteTime, which OneDrive sync touches. Non-zero exit = refresh needed.
+  $env:PYTHONPATH = $SrcDir
+  & $py -m fantasyfootball status players_weekly.csv --max-age-days $StaleDays | Out-Host
+  return ($LASTEXITCODE -ne 0)
 }
 
 function Run-Py($pyExe, $scriptPath){
@@ -4,7 +4,7 @@ REM FantasyFootball — one-click weekly pipeline (Windows / OneDrive)
 REM ------------------------------------------------------------
 REM - Activates venv
 REM - Runs ESPN fetch + rebuild exports
-REM - Refreshes stable names for Power BI (symlink/hardlink/copy)
+REM - Refreshes stable names for Power BI (hardlink/symlink, no copies)
 REM - Verifies outputs & writes health log
 REM - Logs everything to %PROJ%\logs\pipeline_YYYYMMDD-HHMMSS.log
 REM ============================================================
@@ -63,46 +63,9 @@ echo [STEP] rebuild_support_exports.py >> "%PIPELOG%"
 python "%PROJ%\src\rebuild_support_exports.py" >> "%PIPELOG%" 2>&1 || goto :err
 
 REM --- Refresh stable names (Power BI always points to these)
-REM Create a temp PowerShell script on the fly and run it
-set "TMPPS=%TEMP%\stable_names_%TS%.ps1"
-> "%TMPPS%" (
-  echo param(^[string^]$Processed = "%PROCESSED%")
-  echo Set-Location $Processed
-  echo $Map = @{
-  echo ^  "players_weekly.csv"  = "players_weekly_*.csv"
-  echo ^  "team_weekly.csv"     = "team_weekly_*.csv"
-  echo ^  "top_by_position.csv" = "top_by_position_*.csv"
-  echo ^  "top_dst.csv"         = "top_dst_*.csv"
-  echo }
-  echo function Get-NewestByYear(^[string^]$Pattern^) {
-  echo ^  $c = Get-ChildItem -File -Name $Pattern ^| Sort-Object -Descending
-  echo ^  if (-not $c^) { return $null }
-  echo ^  $c ^| ForEach-Object {
-  echo ^    if ($_ -match '\d{4}') { ^[PSCustomObject^]@{Name=$_; Year=[int]$Matches[0]} } else { ^[PSCustomObject^]@{Name=$_; Year=0} }
-  echo ^  } ^| Sort-Object Year, Name -Descending ^| Select-Object -First 1 ^| Select-Object -ExpandProperty Name
-  echo }
-  echo function New-StableFile(^[string^]$StableName,^[string^]$Pattern^) {
-  echo ^  $target = Get-NewestByYear $Pattern
-  echo ^  if (-not $target^) { Write-Warning "No match for $Pattern"; return }
-  echo ^  $stablePath = Join-Path $PWD $StableName
-  echo ^  if (Test-Path $stablePath^) { Remove-Item $stablePath -Force }
-  echo ^  try {
-  echo ^    New-Item -ItemType SymbolicLink -Path $stablePath -Target (Join-Path $PWD $target) -Force ^| Out-Null
-  echo ^    Write-Host "✓ Symlink $StableName -> $target"; return
-  echo ^  } catch {}
-  echo ^  try {
-  echo ^    New-Item -ItemType HardLink -Path $stablePath -Target (Join-Path $PWD $target) -Force ^| Out-Null
-  echo ^    Write-Host "✓ Hardlink $StableName -> $target"; return
-  echo ^  } catch {}
-  echo ^  Copy-Item $target $stablePath -Force
-  echo ^  Write-Host "✓ Copied $StableName (fallback) from $target"
-  echo }
-  echo $Map.GetEnumerator(^) ^| ForEach-Object { New-StableFile $_.Key $_.Value }
-)
-
+REM Hardlink/symlink + atomic rename onto the newest *_YYYY.csv; never copies
 echo [STEP] stable names refresh >> "%PIPELOG%"
-powershell -NoProfile -ExecutionPolicy Bypass -File "%TMPPS%"   >> "%PIPELOG%" 2>&1
-del "%TMPPS%" 2^>NUL
+python "%PROJ%\src\refresh_stable_names.py" --dir "%PROCESSED%" >> "%PIPELOG%" 2>&1 || goto :err
 
 REM --- Verify outputs (players + position + dst required; team optional)
 set "MISSING=0"
@@ -1,50 +1,46 @@
 # run_all.py — the simple conductor
-import sys, os, subprocess
+# Runs the step graph from src/fantasyfootball/pipeline.py in this process.
+import sys, os, argparse
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parent
-PY_EXE = sys.executable  # this will be your venv python when called via .venv\Scripts\python.exe
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-def run_step(name, argv):
-    print(f"[RUN] {name} -> {' '.join(argv)}", flush=True)
-    proc = subprocess.run(argv)
-    rc = proc.returncode
-    if rc == 0:
-        print(f"[OK]  {name} completed", flush=True)
-    else:
-        print(f"[ERROR] {name} failed with errorlevel {rc}", flush=True)
-    return rc
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="FantasyFootball weekly pipeline")
+    ap.add_argument("--jobs", type=int, default=4,
+                    help="max steps running at once (default 4; 1 = strictly sequential)")
+    ap.add_argument("--processes", action="store_true",
+                    help="run steps in a process pool instead of threads")
+    ap.add_argument("--force", action="store_true",
+                    help="run every step even if its inputs are unchanged")
+    ap.add_argument("--plan", action="store_true",
+                    help="show what would run or be skipped, then exit")
+    ap.add_argument("--profile", action="store_true",
+                    help="cProfile + tracemalloc every step (same as FF_PROFILE=1)")
+    ap.add_argument("--compare", type=int, metavar="N", nargs="?", const=5,
+                    help="compare the latest run manifest to the previous N (default 5), then exit")
+    args = ap.parse_args(argv)
+    if args.compare is not None and args.compare < 1:
+        ap.error("--compare needs at least 1 earlier run")
 
-def main():
     # Always run from project root
     os.chdir(PROJECT_ROOT)
     print("[RUNNER] Starting run_all.py at project root:", PROJECT_ROOT, flush=True)
 
-      # ---- STEP 1: fetch ESPN (already there) ----
-    step1 = run_step(
-        "fetch_espn",
-        [PY_EXE, str(PROJECT_ROOT / "src" / "fetch_espn.py")]
-    )
-    if step1 != 0:
-        return step1
+    if args.compare is not None:
+        from fantasyfootball.manifest import compare
+        return 1 if compare(last=args.compare) else 0
 
-    # ---- STEP 2: transform data (new) ----
-    step2 = run_step(
-        "transform_data",
-        [PY_EXE, str(PROJECT_ROOT / "src" / "transform_data.py")]
-    )
-    if step2 != 0:
-        return step2
-    # ---- STEP 3: copy to Power BI drop ----
-    step3 = run_step(
-        "copy_to_powerbi",
-        [PY_EXE, str(PROJECT_ROOT / "src" / "copy_to_powerbi.py")]
-    )
-    if step3 != 0:
-        return step3
-
-    # All steps passed
-    return 0
+    from fantasyfootball.pipeline import default_steps, plan_pipeline, run_pipeline
+    if args.plan:
+        for step, action, reason in plan_pipeline(default_steps(), force=args.force):
+            print(f"  {action:<5} {step.name:<24} {reason}")
+        return 0
+    from fantasyfootball.profiling import enabled as profiling_enabled
+    profile = args.profile or profiling_enabled()
+    return run_pipeline(default_steps(), jobs=args.jobs, processes=args.processes,
+                        force=args.force, profile=profile)
 
 if __name__ == "__main__":
     sys.exit(main())
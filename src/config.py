@@ -5,6 +5,7 @@ FF_ALLOWED_POS = os.getenv("FF_ALLOWED_POS", "QB,RB,WR,TE,K").split(",")
 FF_MAX_WEEKS_CURRENT = int(os.getenv("FF_MAX_WEEKS_CURRENT", "18"))
 DATA_DIR = os.getenv("FF_DATA_DIR", "data/processed")
 PLAYERS_WEEKLY_CSV = os.path.join(DATA_DIR, "players_weekly.csv")
+PLAYER_WEEKS_DIR = os.path.join(DATA_DIR, "player_weeks")   # season=/week= Parquet store
 TOP_BY_POSITION_CSV = os.path.join(DATA_DIR, "top_by_position.csv")
 TOP_DST_CSV = os.path.join(DATA_DIR, "top_dst_2021_2025.csv")
 STRICT_2025_ONLY = True
@@ -0,0 +1,5 @@
+import sys
+
+from fantasyfootball.cli import main
+
+sys.exit(main())
@@ -0,0 +1,150 @@
+# src/fantasyfootball/backfill.py
+# Multi-season ESPN history: teams, scoreboards and box scores for every
+# (season, week) in a range, fetched concurrently under one rate limit.
+# Every finished piece lands in the ESPN cache / week checkpoints as soon as
+# it is fetched, so an interrupted backfill picks up where it stopped.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+OUT_DIR = PROJECT_ROOT / "data" / "processed" / "history"
+FIRST_BOX_SCORE_SEASON = 2019   # espn_api: "Cant use box score before 2019"
+# ESPN requests behind one call, charged to the rate limit up front: League()
+# reads the league, pro players, pro schedule, teams and draft; box_scores(week)
+# reads the league, pro schedule and positional ratings
+CONNECT_REQUESTS = 5
+BOX_SCORE_REQUESTS = 3
+
+
+def season_finished(season, now=None):
+    """No more games or stat corrections: the season ended by March of the next year."""
+    now = now or datetime.now()
+    return season < now.year - 1 or (season < now.year and now.month >= 3)
+
+
+def _season_plan(league, season):
+    """(last week to fetch, the `current_week` to give the cache)."""
+    last = min(league.current_week, league.finalScoringPeriod)
+    # a finished season has no open week: make every week look long settled
+    return last, (last + 2 if season_finished(season) else league.current_week)
+
+
+def box_score_weeks(season, last):
+    """Weeks to pull box scores for: none before FIRST_BOX_SCORE_SEASON."""
+    return range(1, last + 1) if season >= FIRST_BOX_SCORE_SEASON else range(0)
+
+
+def run(creds, seasons, workers=4, rate=2.0, out_dir=OUT_DIR):
+    """Backfill seasons for creds' league; returns an exit code."""
+    import pandas as pd
+    from fantasyfootball import freshness, net
+    from fantasyfootball.data import espn, espn_cache
+    from fantasyfootball.data.espn_players import (
+        week_columns, to_columns, checkpoint_path, write_checkpoint, iter_rows, RowWriter,
+    )
+    from fantasyfootball.ratelimit import TokenBucket
+
+    league_id = creds["league_id"]
+    limiter = TokenBucket(rate, burst=workers)
+    print_lock = threading.Lock()
+
+    def say(msg):
+        with print_lock:
+            print(msg, flush=True)
+
+    def connect(season):
+        limiter.acquire(CONNECT_REQUESTS)
+        return espn.connect(dict(creds, season=season))
+
+    def teams(season, league, last, current):
+        def fetch():                    # league.teams came with the connect: no request
+            return espn.teams_frame(league).to_dict("records")
+        rows, hit = espn_cache.cached(league_id, season, last, "teams", current, fetch)
+        return [dict(r, season=season) for r in rows], hit
+
+    def scoreboard(season, league, last, current):
+        def fetch_many(missing):
+            limiter.acquire()
+            return espn.season_scoreboard_rows(league, missing)
+        by_week, pulled = espn_cache.cached_many(league_id, season, range(1, last + 1), "scoreboard",
+                                                 current, fetch_many)
+        return [dict(r, season=season) for wk in sorted(by_week) for r in by_week[wk]], not pulled
+
+    def box_scores(season, week, league, current):
+        def fetch():
+            limiter.acquire(BOX_SCORE_REQUESTS)
+            return week_columns(league, season, week)
+        cols, hit = espn_cache.cached(league_id, season, week, "box_scores", current, fetch)
+        if isinstance(cols, list):      # entry cached as row dicts by an older version
+            cols = to_columns(cols)
+        path = checkpoint_path(league_id, season, week)
+        if cols is not None and not (hit and path.exists()):
+            write_checkpoint(cols, path, current)
+        return cols, hit
+
+    net.install_espn()
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        leagues = {}
+        for season, fut in [(s, pool.submit(connect, s)) for s in seasons]:
+            try:
+                leagues[season] = fut.result()
+            except Exception as e:
+                say(f"[ERROR] {season}: could not open league {league_id}: {e}")
+                failed.append((season, "league"))
+        plans = {s: _season_plan(lg, s) for s, lg in leagues.items()}
+
+        tasks = {}
+        for season, league in leagues.items():
+            last, current = plans[season]
+            tasks[pool.submit(teams, season, league, last, current)] = (season, "teams")
+            tasks[pool.submit(scoreboard, season, league, last, current)] = (season, "scoreboard")
+            for week in box_score_weeks(season, last):
+                tasks[pool.submit(box_scores, season, week, league, current)] = (season, week)
+        no_box = [s for s in leagues if s < FIRST_BOX_SCORE_SEASON]
+        if no_box:
+            say(f"[INFO] No box scores for {no_box}: ESPN has none before {FIRST_BOX_SCORE_SEASON}")
+
+        results = {}
+        for fut in as_completed(tasks):
+            season, what = tasks[fut]
+            label = f"{season} week {what:>2}" if isinstance(what, int) else f"{season} {what}"
+            try:
+                data, hit = fut.result()
+            except Exception as e:
+                say(f"[WARN] {label}: {e}")
+                failed.append((season, what))
+                continue
+            results[(season, what)] = data
+            if data is None:
+                say(f"[WARN] {label}: no box scores returned")
+            else:
+                say(f"[OK] {label}{' (cached)' if hit else ''}")
+
+    # Season-long tables in season/week order, rebuilt from what is on disk
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    source = f"espn:league/{league_id}/seasons/{seasons[0]}-{seasons[-1]}"
+    done = sorted(leagues)
+    for what, name in (("teams", "espn_teams.csv"), ("scoreboard", "espn_scoreboard.csv")):
+        rows = [r for s in done for r in results.get((s, what), [])]
+        df = pd.DataFrame(rows)
+        df.to_csv(out_dir / name, index=False)
+        freshness.record(out_dir / name, source, df)
+        say(f"[OK] Wrote {out_dir / name} with {len(df)} rows")
+
+    paths = (checkpoint_path(league_id, s, wk) for s in done for wk in box_score_weeks(s, plans[s][0]))
+    with RowWriter(out_dir / "players_weekly_espn.csv") as w:
+        w.write(r for p in paths if p.exists() for r in iter_rows(p))
+    freshness.record(w.path, source, seasons=sorted({s for s, _ in w.weeks}),
+                     weeks=sorted({wk for _, wk in w.weeks}))
+    say(f"[OK] Wrote {w.path} with {w.rows} rows")
+    net.report()
+
+    if failed:
+        say(f"[ERROR] {len(failed)} pieces failed; run the same backfill again to fetch only those")
+        return 1
+    return 0
@@ -0,0 +1,227 @@
+# src/fantasyfootball/cli.py
+# `python -m fantasyfootball <command>` — one entry point for the scripts.
+# Keep the top of this file to stdlib only: pandas, dotenv, espn_api etc. are
+# imported inside the command that needs them, so cheap commands like
+# `status` start fast (see `bench` and STARTUP_BUDGET_MS).
+
+import os, sys, time, argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = PROJECT_ROOT / "src"
+
+FETCH_STEPS = {"espn": "fetch_espn", "players": "fetch_espn_players", "nflverse": "fetch_nflverse"}
+STATUS_FILES = ["espn_teams.csv", "espn_scoreboard.csv", "espn_master.csv",
+                "players_weekly.csv", "top_by_position.csv"]
+
+# command line -> max wall time in ms for a cold `python -m fantasyfootball ...`
+STARTUP_BUDGET_MS = {
+    "status": 150,
+    "--help": 150,
+}
+# modules that must not be imported by the fast commands
+HEAVY_MODULES = ("pandas", "numpy", "espn_api", "dotenv", "requests", "psutil", "pyarrow")
+
+
+def _run_steps(names, args, jobs=4):
+    from fantasyfootball.pipeline import default_steps, run_pipeline
+    from fantasyfootball.profiling import enabled as profiling_enabled
+    steps = [s for s in default_steps() if s.name in names]
+    return run_pipeline(steps, jobs=jobs, state_path=None, manifest_dir=None,
+                        profile=args.profile or profiling_enabled())
+
+
+def cmd_fetch(args):
+    names = FETCH_STEPS.values() if args.source == "all" else [FETCH_STEPS[args.source]]
+    return _run_steps(set(names), args, jobs=args.jobs)
+
+
+def cmd_transform(args):
+    return _run_steps({"transform_data"}, args)
+
+
+def cmd_rebuild(args):
+    return _run_steps({"rebuild_support_exports"}, args)
+
+
+def cmd_export(args):
+    return _run_steps({"copy_to_powerbi"}, args)
+
+
+def cmd_status(args):
+    """Are the outputs present and current? Answered from the freshness index.
+
+    Exit 1 if a file is missing, changed since it was indexed, older than
+    --max-age-days (by fetch time, not mtime) or lacks --week.
+    """
+    from config import DATA_DIR
+    from fantasyfootball import freshness
+
+    index = freshness.load(DATA_DIR)
+    names = args.files or (sorted(index) if args.week else STATUS_FILES)
+    rc = 0
+    for name in names:
+        p = Path(DATA_DIR) / name
+        entry = index.get(name)
+        if entry is None:
+            # not indexed yet (written by an older script): fall back to mtime
+            try:
+                age = (time.time() - p.stat().st_mtime) / 86400
+            except OSError:
+                print(f"[MISSING] {p}")
+                rc = 1
+                continue
+            problem = "not indexed" if args.week else None
+        else:
+            age = freshness.age_days(entry)
+            problem = None if freshness.verify(DATA_DIR, entry) else "changed since indexed"
+            if args.week and not problem and not freshness.has_week(entry, args.week, args.season):
+                problem = f"week {args.week} not present"
+        if not problem and args.max_age_days is not None and age > args.max_age_days:
+            problem = "stale"
+        rc = rc or int(problem is not None)
+        detail = "" if entry is None else f"  weeks {_span(entry.get('weeks'))}  source {entry['source']}"
+        print(f"[{'OK' if not problem else 'STALE'}] {p}  {age:.1f} days old{detail}"
+              + (f"  ({problem})" if problem else ""))
+    return rc
+
+
+def _span(weeks):
+    if not weeks:
+        return "-"
+    return f"{weeks[0]}-{weeks[-1]}" if len(weeks) > 1 else str(weeks[0])
+
+
+def cmd_schedule(args):
+    from fantasyfootball.data import espn
+    from fantasyfootball.scheduler import run
+    try:
+        creds = espn.load_credentials()
+    except (FileNotFoundError, ValueError) as e:
+        print("[ERROR]", e, file=sys.stderr)
+        return 1
+    try:
+        return run(creds, max_polls=args.max_polls)
+    except KeyboardInterrupt:
+        print("[INFO] Scheduler stopped")
+        return 0
+
+
+def cmd_backfill(args):
+    from fantasyfootball.backfill import run
+    from fantasyfootball.seasons import parse_seasons
+    from fantasyfootball.data import espn
+    try:
+        seasons = parse_seasons(args.seasons)
+        if not seasons:
+            raise ValueError(f"no seasons in {args.seasons!r} (write ranges low-high, e.g. 2019-2024)")
+        creds = espn.load_credentials()
+    except (FileNotFoundError, ValueError) as e:
+        print("[ERROR]", e, file=sys.stderr)
+        return 1
+    if args.league:
+        creds["league_id"] = args.league
+    return run(creds, seasons, workers=args.workers, rate=args.rate)
+
+
+def cmd_replay(args):
+    from fantasyfootball.replay import serve
+    try:
+        serve(args.dir, port=args.port, latency_ms=args.latency_ms,
+              jitter_ms=args.jitter_ms, error_rate=args.error_rate)
+    except KeyboardInterrupt:
+        print("[INFO] Replay server stopped")
+    return 0
+
+
+def _time_command(argv, runs):
+    import subprocess
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.getenv("PYTHONPATH")])))
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "fantasyfootball", *argv], env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        ms = (time.perf_counter() - t0) * 1000
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def heavy_imports(argv):
+    """Heavy modules pulled in by `python -m fantasyfootball <argv>` (via -X importtime)."""
+    import subprocess
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC_DIR), os.getenv("PYTHONPATH")])))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "fantasyfootball", *argv],
+                          env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    loaded = {line.rsplit("|", 1)[-1].strip() for line in proc.stderr.splitlines() if "|" in line}
+    return sorted(m for m in loaded if m.split(".")[0] in HEAVY_MODULES)
+
+
+def cmd_bench(args):
+    """Startup time of each budgeted command (best of N); exit 1 if over budget."""
+    rc = 0
+    for cmd, budget in STARTUP_BUDGET_MS.items():
+        argv = cmd.split()
+        ms = _time_command(argv, args.runs)
+        heavy = heavy_imports(argv)
+        over = ms > budget or bool(heavy)
+        rc = rc or int(over)
+        print(f"[{'OVER' if over else 'OK'}] {cmd:<10} {ms:7.1f} ms (budget {budget} ms)"
+              + (f"  heavy imports: {', '.join(heavy)}" if heavy else ""))
+    return rc
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog="fantasyfootball", description="FantasyFootball data pipeline")
+    ap.add_argument("--profile", action="store_true",
+                    help="cProfile + tracemalloc the steps a command runs (same as FF_PROFILE=1)")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("fetch", help="download ESPN / nflverse data")
+    p.add_argument("source", nargs="?", default="all", choices=["all", *FETCH_STEPS])
+    p.add_argument("--jobs", type=int, default=3, help="fetches running at once (default 3)")
+    p.set_defaults(func=cmd_fetch)
+
+    sub.add_parser("transform", help="clean ESPN tables and build espn_master").set_defaults(func=cmd_transform)
+    sub.add_parser("rebuild", help="rebuild top_by_position / D/ST exports").set_defaults(func=cmd_rebuild)
+    sub.add_parser("export", help="copy outputs into powerbi/data").set_defaults(func=cmd_export)
+
+    p = sub.add_parser("status", help="check the processed outputs exist and are fresh")
+    p.add_argument("files", nargs="*", help="output names to check (default: the key outputs)")
+    p.add_argument("--max-age-days", type=float, default=None, help="flag outputs fetched longer ago than this")
+    p.add_argument("--week", type=int, default=None, help="require this week to be present")
+    p.add_argument("--season", type=int, default=None, help="season for --week")
+    p.set_defaults(func=cmd_status)
+
+    p = sub.add_parser("schedule", help="game-day daemon: poll ESPN adaptively, rebuild on change")
+    p.add_argument("--max-polls", type=int, default=None, help="stop after this many polls")
+    p.set_defaults(func=cmd_schedule)
+
+    p = sub.add_parser("backfill", help="fetch past ESPN seasons (resumable) into data/processed/history")
+    p.add_argument("seasons", help="e.g. 2019-2024 or 2019,2021")
+    p.add_argument("--league", type=int, default=None, help="league id (default: LEAGUE_ID from .env)")
+    p.add_argument("--workers", type=int, default=4, help="pulls running at once (default 4)")
+    p.add_argument("--rate", type=float, default=2.0, help="ESPN requests per second, 0 = no limit (default 2)")
+    p.set_defaults(func=cmd_backfill)
+
+    p = sub.add_parser("replay", help="serve recorded HTTP fixtures (FF_HTTP_RECORD) for offline runs")
+    p.add_argument("dir", help="fixture folder written with FF_HTTP_RECORD")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--latency-ms", type=float, default=0.0, help="added to every response")
+    p.add_argument("--jitter-ms", type=float, default=0.0, help="extra random latency, 0..N ms")
+    p.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered 503")
+    p.set_defaults(func=cmd_replay)
+
+    p = sub.add_parser("bench", help="check command startup against STARTUP_BUDGET_MS")
+    p.add_argument("--runs", type=int, default=5, help="runs per command; best is kept (default 5)")
+    p.set_defaults(func=cmd_bench)
+    return ap
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Config paths and several scripts are relative to the project root.
+    os.chdir(PROJECT_ROOT)
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+    return args.func(args)
@@ -0,0 +1,118 @@
+# src/fantasyfootball/data/assets.py
+# Local copies of downloaded release files (the nflverse .csv.gz assets) with
+# the validators the server sent (ETag / Last-Modified). A re-run sends a
+# conditional GET: a 304, or a 200 whose bytes hash the same as the copy we
+# have, means the asset was not republished and the caller can skip parsing.
+
+import os, json, hashlib
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ASSET_DIR = PROJECT_ROOT / "data" / "interim" / "assets"
+
+
+class Cancelled(Exception):
+    """fetch() was told to stop (another mirror won) before the body was read."""
+
+
+def _paths(url, root):
+    folder = Path(root) / urlsplit(url).netloc.replace(":", "_")
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:24]
+    return folder / f"{key}.json", folder / f"{key}.body"
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def load_meta(url, root=ASSET_DIR):
+    meta_path, body_path = _paths(url, root)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta if body_path.exists() else None
+
+
+def forget(url, root=ASSET_DIR):
+    """Drop the stored copy (e.g. it didn't parse), so the next fetch downloads it again."""
+    for path in _paths(url, root):
+        if path.exists():
+            path.unlink()
+
+
+def version(meta):
+    """What freshness records as the upstream version of an asset: its content
+    hash, not the ETag, so a re-published file with the same bytes (new ETag)
+    still counts as the version already processed."""
+    return "sha256:" + meta["sha256"][:16]
+
+
+def _read(r, url, cancel):
+    """The response body, closing the connection early once cancel is set."""
+    chunks = []
+    for block in r.iter_content(1 << 16):
+        if cancel.is_set():
+            r.close()
+            raise Cancelled(url)
+        chunks.append(block)
+    return b"".join(chunks)
+
+
+def fetch(url, root=ASSET_DIR, get=None, on_headers=None, cancel=None):
+    """(body, meta, changed) for url, downloading only what changed.
+
+    meta holds url, etag, last_modified, sha256, fetched_at (last download)
+    and checked_at (last time the server was asked). changed is False on a
+    304 or when the bytes hash the same as the stored copy. HTTP errors are
+    raised (raise_for_status). on_headers(response), if given, is called as
+    soon as the status and headers are in, before the body is downloaded.
+    cancel (a threading.Event) set while the body streams in closes the
+    response and raises Cancelled; nothing is stored.
+    """
+    if get is None:
+        from fantasyfootball.net import get
+    meta_path, body_path = _paths(url, root)
+    old = load_meta(url, root)
+    headers = {}
+    if old:
+        if old.get("etag"):
+            headers["If-None-Match"] = old["etag"]
+        if old.get("last_modified"):
+            headers["If-Modified-Since"] = old["last_modified"]
+    if on_headers is None and cancel is None:
+        r = get(url, headers=headers)
+    else:
+        r = get(url, headers=headers, stream=True)    # body is read below, after the callback
+        if cancel is not None and cancel.is_set():
+            r.close()
+            raise Cancelled(url)
+        if on_headers is not None:
+            on_headers(r)
+    now = datetime.now().isoformat(timespec="seconds")
+    if old and r.status_code == 304:
+        old["checked_at"] = now
+        _write(meta_path, json.dumps(old, indent=2).encode("utf-8"))
+        return body_path.read_bytes(), old, False
+    r.raise_for_status()
+    body = r.content if cancel is None else _read(r, url, cancel)
+    digest = hashlib.sha256(body).hexdigest()
+    changed = not old or old["sha256"] != digest
+    meta = {
+        "url": url,
+        "etag": r.headers.get("ETag"),
+        "last_modified": r.headers.get("Last-Modified"),
+        "sha256": digest,
+        "size": len(body),
+        "fetched_at": now if changed else old["fetched_at"],
+        "checked_at": now,
+    }
+    if changed:
+        _write(body_path, body)
+    _write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+    return body, meta, changed
@@ -0,0 +1,153 @@
+# src/fantasyfootball/data/espn.py
+# ESPN league access as plain functions: read/validate credentials, connect,
+# and turn league objects into DataFrames.
+
+import os
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ENV_FILE = PROJECT_ROOT / ".env"
+SCOREBOARD_COLS = ["week", "home_team", "away_team", "home_score", "away_score"]
+
+
+def mask(v):
+    if not v: return "<missing>"
+    return f"{v[:4]}...{v[-4:]}" if len(v) >= 8 else "<short>"
+
+
+def parse_league_ids(league_id, league_ids=None):
+    """(primary league id, [all league ids]) from LEAGUE_ID / LEAGUE_IDS values.
+
+    LEAGUE_IDS is a comma-separated list; the primary league is LEAGUE_ID, or
+    the first listed one, and is always in the list. Without LEAGUE_IDS the
+    list is empty (single-league mode). Raises ValueError on non-digit ids.
+    """
+    ids = [x.strip() for x in (league_ids or "").split(",") if x.strip()]
+    if league_id:
+        ids = [league_id] + [x for x in ids if x != league_id] if ids else []
+    bad = [x for x in ids + [league_id or ""] if x and not x.isdigit()]
+    if bad:
+        raise ValueError(f"League ids must be digits: {', '.join(bad)}")
+    ids = [int(x) for x in ids]
+    primary = int(league_id) if league_id else (ids[0] if ids else None)
+    return primary, ids
+
+
+def league_dir(out_dir, league_id):
+    """Per-league output folder used in multi-league mode."""
+    return Path(out_dir) / f"league={league_id}"
+
+
+def publish_primary(src, dst):
+    """Link a per-league output to the top-level name the pipeline reads."""
+    from fantasyfootball import freshness
+    from fantasyfootball.stable_names import publish
+    publish(Path(src).resolve(), dst)
+    freshness.copy_entry(src, dst)
+
+
+def load_credentials(env_file=ENV_FILE):
+    """Read ESPN_S2 / SWID / LEAGUE_ID(S) / SEASON from .env + environment.
+
+    Raises FileNotFoundError if the .env is missing and ValueError naming
+    every missing/invalid value.
+    """
+    from dotenv import load_dotenv
+
+    if not Path(env_file).exists():
+        raise FileNotFoundError(f".env file not found at: {env_file}")
+    load_dotenv(dotenv_path=str(env_file))
+
+    espn_s2   = os.getenv("ESPN_S2")
+    swid      = os.getenv("SWID")                # must include {curly braces}
+    league_id = os.getenv("LEAGUE_ID")
+    season    = os.getenv("SEASON", "2025")
+    try:
+        league_id, league_ids = parse_league_ids(league_id, os.getenv("LEAGUE_IDS"))
+    except ValueError:
+        league_id, league_ids = None, []
+
+    problems = []
+    if not espn_s2: problems.append("ESPN_S2")
+    if not swid or not (swid.startswith("{") and swid.endswith("}")):
+        problems.append("SWID (must include curly braces)")
+    if not league_id:
+        problems.append("LEAGUE_ID or LEAGUE_IDS (digits only)")
+    try:
+        int(season)
+    except Exception:
+        problems.append("SEASON (must be an integer)")
+    if problems:
+        raise ValueError("Missing/invalid env vars: " + ", ".join(problems))
+
+    return {"espn_s2": espn_s2, "swid": swid, "league_id": league_id,
+            "league_ids": league_ids, "season": int(season)}
+
+
+def connect(creds):
+    from espn_api.football import League
+    from fantasyfootball import net
+    net.install_espn()
+    return League(league_id=creds["league_id"], year=creds["season"],
+                  espn_s2=creds["espn_s2"], swid=creds["swid"])
+
+
+def teams_frame(league):
+    import pandas as pd
+    return pd.DataFrame([{
+        "team_id": t.team_id,
+        "team_name": t.team_name,
+        "wins": t.wins,
+        "losses": t.losses,
+        "ties": t.ties
+    } for t in league.teams])
+
+
+def scoreboard_rows(league, week=None):
+    """Matchups for `week` (default: the league's current week) as dicts."""
+    week = week or league.current_week
+    return [{
+        "week": week,
+        "home_team": m.home_team.team_name,
+        "away_team": m.away_team.team_name,
+        "home_score": m.home_score,
+        "away_score": m.away_score
+    } for m in league.scoreboard(week)]
+
+
+def scoreboard_frame(league, week=None):
+    """Matchups for `week` (default: the league's current week)."""
+    import pandas as pd
+    return pd.DataFrame(scoreboard_rows(league, week))
+
+
+def season_scoreboard_rows(league, weeks):
+    """{week: matchup rows} for several matchup periods from one request.
+
+    league.scoreboard(week) downloads the whole season schedule and keeps one
+    week, so calling it per week repeats the same request each time.
+    """
+    data = league.espn_request.league_get(params={"view": "mMatchupScore"})
+    names = {t.team_id: t.team_name for t in league.teams}
+    out = {int(w): [] for w in weeks}
+    for m in data["schedule"]:
+        week = m["matchupPeriodId"]
+        if week not in out:
+            continue
+        home, away = m.get("home", {}), m.get("away", {})    # no away side on a playoff bye
+        out[week].append({
+            "week": week,
+            "home_team": names.get(home.get("teamId"), ""),
+            "away_team": names.get(away.get("teamId"), ""),
+            "home_score": home.get("totalPoints", 0),
+            "away_score": away.get("totalPoints", 0),
+        })
+    return out
+
+
+def replace_weeks(table, sb):
+    """A week-keyed scoreboard table with sb's weeks swapped in."""
+    import pandas as pd
+    keep = table[~table["week"].isin(sb["week"].unique())]
+    out = pd.concat([keep, sb], ignore_index=True)
+    return out.sort_values("week", kind="stable").reset_index(drop=True)
@@ -0,0 +1,94 @@
+# src/fantasyfootball/data/espn_cache.py
+# On-disk cache of ESPN results keyed by (league, season, week, endpoint).
+# Finished weeks don't change apart from stat corrections, so:
+#   - the current (in-progress) week is always fetched and never stored,
+#   - a finished week cached while it was still inside the correction window
+#     (i.e. the week right after it was current) is re-fetched once the entry
+#     is older than the TTL,
+#   - anything cached after that is final and never fetched again.
+
+import os, json, time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CACHE_DIR = PROJECT_ROOT / "data" / "interim" / "espn_cache"
+CORRECTION_TTL_HOURS = 24
+
+
+def cache_path(league_id, season, week, endpoint, root=CACHE_DIR):
+    return Path(root) / f"{league_id}_{season}" / endpoint / f"week_{int(week):02d}.json"
+
+
+def is_fresh(entry, current_week, ttl_hours=CORRECTION_TTL_HOURS, now=None):
+    """Can a cached entry be used instead of asking ESPN again?"""
+    week = entry["week"]
+    if week >= current_week or entry["current_week"] <= week:
+        return False                                # still being played, or cached while it was
+    if entry["current_week"] > week + 1:
+        return True                                 # cached after the correction window
+    return (now or time.time()) - entry["cached_at"] < ttl_hours * 3600
+
+
+def load(path):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def store(path, entry):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(entry), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _entry(league_id, season, week, endpoint, current_week, rows):
+    return {
+        "league_id": league_id, "season": season, "week": int(week),
+        "endpoint": endpoint, "current_week": int(current_week),
+        "cached_at": time.time(),
+        "rows": rows,
+    }
+
+
+def cached(league_id, season, week, endpoint, current_week, fetch,
+           ttl_hours=CORRECTION_TTL_HOURS, root=CACHE_DIR):
+    """Rows for one (league, season, week, endpoint); returns (rows, from_cache).
+
+    fetch() is only called when there is no usable entry. A None result
+    (ESPN had nothing) or an open week (>= current_week) is passed through
+    and not cached.
+    """
+    path = cache_path(league_id, season, week, endpoint, root)
+    entry = load(path)
+    if entry is not None and is_fresh(entry, current_week, ttl_hours):
+        return entry["rows"], True
+    rows = fetch()
+    if rows is not None and week < current_week:
+        store(path, _entry(league_id, season, week, endpoint, current_week, rows))
+    return rows, False
+
+
+def cached_many(league_id, season, weeks, endpoint, current_week, fetch_many,
+                ttl_hours=CORRECTION_TTL_HOURS, root=CACHE_DIR):
+    """cached() for endpoints that return many weeks per request.
+
+    fetch_many(missing) -> {week: rows} is called once with every week that
+    has no usable entry. Returns ({week: rows}, sorted list of fetched weeks).
+    """
+    out, missing = {}, []
+    for week in weeks:
+        entry = load(cache_path(league_id, season, week, endpoint, root))
+        if entry is not None and is_fresh(entry, current_week, ttl_hours):
+            out[int(week)] = entry["rows"]
+        else:
+            missing.append(int(week))
+    if missing:
+        for week, rows in fetch_many(missing).items():
+            if week < current_week:
+                store(cache_path(league_id, season, week, endpoint, root),
+                      _entry(league_id, season, week, endpoint, current_week, rows))
+            out[int(week)] = rows
+    return out, missing
@@ -0,0 +1,256 @@
+# src/fantasyfootball/data/espn_players.py
+# Weekly player rows from ESPN box scores, with one checkpoint file per
+# (league, season, week) so an interrupted pull can resume where it stopped.
+# The merged output is streamed through RowWriter, so memory stays at about
+# one week of rows however many weeks/seasons go into it.
+
+import os, csv, json, heapq
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CHECKPOINT_DIR = PROJECT_ROOT / "data" / "interim" / "espn_players"
+FIELDNAMES = ["player", "team", "position", "season", "week", "ppr_points"]
+NUMERIC = {"season": int, "week": int, "ppr_points": float}
+BUFFER_ROWS = 10_000
+
+
+# field -> lineup-item attributes to try, in order (legacy and newer espn_api)
+ATTRS = {
+    "name":   ("name", "playerName"),
+    "team":   ("proTeam",),
+    "pos":    ("position",),
+    "slot":   ("slot_position",),
+    "points": ("points", "ppr_points"),
+}
+DEFAULTS = {"name": "", "team": "", "pos": "", "slot": "", "points": 0.0}
+SKIP_SLOTS = ("BE", "IR")
+_accessors = {}     # lineup-item class -> {field: getter}
+
+
+def _getter(name, default):
+    if name is None:
+        return lambda li: default
+    return lambda li: getattr(li, name, default)
+
+
+def accessors(li):
+    """{field: getter} for ATTRS, resolved once per lineup-item class.
+
+    Which attribute name a class uses is worked out on its first instance;
+    every later instance reuses the getters instead of probing with hasattr.
+    """
+    cls = type(li)
+    acc = _accessors.get(cls)
+    if acc is None:
+        acc = {f: _getter(next((n for n in names if hasattr(li, n)), None), DEFAULTS[f])
+               for f, names in ATTRS.items()}
+        _accessors[cls] = acc
+    return acc
+
+
+def week_columns(league, season, week):
+    """Started players for one week as {field: [values]} in FIELDNAMES order;
+    None if ESPN returned no box scores."""
+    box_scores = league.box_scores(week)
+    if not box_scores:
+        return None
+    player, team, pos, pts = [], [], [], []
+    for bs in box_scores:
+        for side in ("home_lineup", "away_lineup"):
+            for li in (getattr(bs, side, None) or []):
+                acc = accessors(li)
+                if str(acc["slot"](li) or "").upper() in SKIP_SLOTS:
+                    continue
+                player.append(str(acc["name"](li)))
+                team.append(str(acc["team"](li) or "").upper())
+                pos.append(str(acc["pos"](li) or "").upper())
+                pts.append(float(acc["points"](li) or 0.0))
+    n = len(player)
+    return {"player": player, "team": team, "position": pos,
+            "season": [int(season)] * n, "week": [int(week)] * n, "ppr_points": pts}
+
+
+def to_columns(rows):
+    return {f: [r[f] for r in rows] for f in FIELDNAMES}
+
+
+# ---- checkpoints ----
+
+def checkpoint_path(league_id, season, week, root=CHECKPOINT_DIR):
+    return Path(root) / f"{league_id}_{season}" / f"week_{int(week):02d}.csv"
+
+
+def write_rows(rows, path):
+    """Write rows via a temp file + rename, so a file that exists is complete."""
+    with RowWriter(path) as w:
+        w.write(rows)
+
+
+def write_columns(cols, path):
+    """write_rows for a {field: [values]} block."""
+    with RowWriter(path) as w:
+        w.write_columns(cols)
+
+
+def _written_at(path):
+    return Path(path).with_suffix(".json")
+
+
+def write_checkpoint(cols, path, current_week):
+    """write_columns plus a sidecar with the league's current_week at write
+    time, so a week checkpointed while it was still being played is not
+    taken for final once the league moves on."""
+    meta = _written_at(path)
+    if meta.exists():
+        meta.unlink()               # no stale "final" mark while the CSV is replaced
+    write_columns(cols, path)
+    tmp = meta.with_name(meta.name + ".tmp")
+    tmp.write_text(json.dumps({"current_week": int(current_week)}), encoding="utf-8")
+    os.replace(tmp, meta)
+
+
+def read_rows(path):
+    return list(iter_rows(path))
+
+
+def iter_rows(path):
+    """Rows of a CSV or Parquet output, one at a time."""
+    if str(path).endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=BUFFER_ROWS):
+            yield from batch.to_pylist()
+        return
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+class RowWriter:
+    """Stream rows to a .csv or .parquet file with at most buffer_rows in memory.
+
+    Rows are buffered column-wise and written to <path>.tmp every buffer_rows
+    rows (one Parquet row group per flush); close() renames it over path, so
+    readers never see a partial file. Used as a context manager, an exception
+    discards the tmp. Keeps the row count and the (season, week) pairs written.
+    """
+
+    def __init__(self, path, buffer_rows=BUFFER_ROWS):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.tmp = self.path.with_name(self.path.name + ".tmp")
+        self.parquet = self.path.suffix == ".parquet"
+        self.buffer_rows = buffer_rows
+        self.buffer = {f: [] for f in FIELDNAMES}
+        self.rows, self.weeks = 0, set()
+        self._file = self._writer = None
+
+    def _buffered(self):
+        return len(self.buffer[FIELDNAMES[0]])
+
+    def write(self, rows):
+        """Write row dicts (e.g. from iter_rows)."""
+        buf = self.buffer
+        for r in rows:
+            for f in FIELDNAMES:
+                buf[f].append(r[f])
+            if self._buffered() >= self.buffer_rows:
+                self.flush()
+
+    def write_columns(self, cols):
+        """Write a {field: [values]} block (e.g. from week_columns)."""
+        for f in FIELDNAMES:
+            self.buffer[f].extend(cols[f])
+        if self._buffered() >= self.buffer_rows:
+            self.flush()
+
+    def flush(self):
+        buf = self.buffer
+        self.weeks.update(zip(map(int, buf["season"]), map(int, buf["week"])))
+        if self.parquet:
+            self._flush_parquet()
+        else:
+            if self._file is None:
+                self._file = open(self.tmp, "w", newline="", encoding="utf-8")
+                self._writer = csv.writer(self._file)
+                self._writer.writerow(FIELDNAMES)
+            self._writer.writerows(zip(*(buf[f] for f in FIELDNAMES)))
+        self.rows += self._buffered()
+        for f in FIELDNAMES:
+            buf[f] = []
+
+    def _flush_parquet(self):
+        import pyarrow as pa, pyarrow.parquet as pq
+        types = {int: pa.int64(), float: pa.float64()}
+        schema = pa.schema([(f, types.get(NUMERIC.get(f), pa.string())) for f in FIELDNAMES])
+        cols = {f: [NUMERIC.get(f, str)(v) for v in self.buffer[f]] for f in FIELDNAMES}
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.tmp, schema)
+        self._writer.write_table(pa.table(cols, schema=schema))
+
+    def close(self):
+        if self._buffered() or self._writer is None:     # also writes a header-only file
+            self.flush()
+        (self._writer if self.parquet else self._file).close()
+        os.replace(self.tmp, self.path)
+
+    def discard(self):
+        closer = self._writer if self.parquet else self._file
+        if closer is not None:
+            closer.close()
+        if self.tmp.exists():
+            self.tmp.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def checkpoint_written_at(path):
+    """The league's current_week when the checkpoint was written, or None."""
+    try:
+        return int(json.loads(_written_at(path).read_text(encoding="utf-8"))["current_week"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def completed_weeks(league_id, season, final_before, root=CHECKPOINT_DIR):
+    """Weeks with a checkpoint that can be trusted: finished weeks
+    (< final_before, i.e. the league's current week) that were already
+    finished when checkpointed. Checkpoints without a sidecar don't count."""
+    folder = Path(root) / f"{league_id}_{season}"
+    if not folder.is_dir():
+        return set()
+    done = set()
+    for p in folder.glob("week_*.csv"):
+        week, written_at = int(p.stem.split("_")[1]), checkpoint_written_at(p)
+        if written_at is not None and written_at > week and week < final_before:
+            done.add(week)
+    return done
+
+
+# ---- incremental output ----
+
+def _order(row):
+    return (int(row["season"]), int(row["week"]))
+
+
+def covered_weeks(rows, season):
+    return {int(r["week"]) for r in rows if int(r["season"]) == int(season)}
+
+
+def upsert(existing, fresh, season, weeks):
+    """Stream existing rows with freshly fetched ones upserted by
+    (player, team, season, week).
+
+    `weeks` are the weeks of `season` that were re-fetched: all their old rows
+    are dropped, so a player benched since the last pull doesn't linger and no
+    old key can collide with a fresh row. Both inputs must be ordered by
+    (season, week), as the outputs written here are; so is the result.
+    """
+    season, weeks = int(season), {int(w) for w in weeks}
+    kept = (r for r in existing if not (int(r["season"]) == season and int(r["week"]) in weeks))
+    return heapq.merge(kept, fresh, key=_order)
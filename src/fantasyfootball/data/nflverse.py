@@ -0,0 +1,259 @@
+# src/fantasyfootball/data/nflverse.py
+# Download helpers for nflverse player stats.
+
+import io, os, json, time, queue, threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# The players_weekly columns the pipeline reads (rebuild_support_exports.py
+# picks season/week/position/name/team/id/ppr from these) and compact dtypes
+# for them. Anything else in the release file is never parsed.
+WEEKLY_SCHEMA = {
+    "player_id": "string",
+    "player_name": "string",
+    "player_display_name": "string",
+    "position": "category",
+    "position_group": "category",
+    "recent_team": "category",
+    "team": "category",
+    "opponent_team": "category",
+    "season": "int16",
+    "week": "int8",
+    "season_type": "category",
+    "fantasy_points": "float32",
+    "fantasy_points_ppr": "float32",
+}
+CHUNK_ROWS = 50_000
+WEEKLY_URL = "https://github.com/nflverse/nflverse-data/releases/download/players/players_weekly_{season}.csv.gz"
+
+# Known-good public mirrors sometimes relocate; try a couple of common endpoints.
+CANDIDATES = [
+    # nflverse often mirrors via GitHub raw; this pattern keeps us unblocked.
+    "https://raw.githubusercontent.com/nflverse/nflfastR-data/master/data/player_stats/player_stats_{year}.csv.gz",
+    "https://github.com/nflverse/nflfastR-data/raw/master/data/player_stats/player_stats_{year}.csv.gz"
+]
+# download_any tries the fastest mirror first and starts the next one if no
+# status line came back within HEDGE_S (0 = race them all at once). Latency per mirror
+# is kept in MIRROR_STATS between runs.
+HEDGE_S = float(os.getenv("FF_MIRROR_HEDGE_S", "2"))
+MIRROR_STATS = PROJECT_ROOT / "data" / "interim" / "mirror_latency.json"
+LATENCY_ALPHA = 0.3     # weight of the newest sample in the moving average
+
+
+def load_mirror_stats(path=MIRROR_STATS):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_mirror_stats(stats, path=MIRROR_STATS):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(stats, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def rank_mirrors(candidates, stats):
+    """Healthy mirrors fastest first, then ones whose last attempts failed.
+    Never-measured mirrors count as fast, so they get measured; ties keep
+    the listed order."""
+    def key(tpl):
+        s = stats.get(tpl, {})
+        return s.get("failing", 0) > 0, s.get("ms", 0.0)
+    return sorted(candidates, key=key)
+
+
+def note_latency(stats, tpl, ms, ok=True):
+    """Fold one finished attempt into stats[tpl]."""
+    s = stats.setdefault(tpl, {"ms": ms, "ok": 0, "failed": 0, "failing": 0})
+    s["ms"] = round((1 - LATENCY_ALPHA) * s["ms"] + LATENCY_ALPHA * ms, 1)
+    s["ok" if ok else "failed"] += 1
+    s["failing"] = 0 if ok else s["failing"] + 1
+
+
+def download_any(year, candidates=CANDIDATES, hedge_s=HEDGE_S, stats_path=None):
+    """(url, body, asset meta, changed) from the first mirror to answer, via
+    a conditional GET (see assets.fetch); None if they all fail.
+
+    Hedged on time to first byte: the fastest known mirror starts first, and
+    the next one starts if hedge_s passes without a mirror sending its status
+    line, or as soon as a mirror fails. Once a mirror answers 200/304 no more
+    are started while its body downloads. The first complete good response
+    wins; mirrors still in flight are cancelled (their connections closed,
+    nothing stored) and get no latency sample.
+    """
+    from fantasyfootball.data import assets
+
+    stats_path = stats_path or MIRROR_STATS
+    stats = load_mirror_stats(stats_path)
+    pending = rank_mirrors(candidates, stats)
+    results = queue.Queue()
+    cancel = threading.Event()
+    running = {}          # template -> start time
+    answered = set()      # templates whose status line came back good
+
+    def attempt(tpl, url):
+        try:
+            got = assets.fetch(url, on_headers=lambda r: results.put((tpl, "headers", r.status_code)),
+                               cancel=cancel)
+            results.put((tpl, "done", got))
+        except Exception as e:
+            results.put((tpl, "failed", e))
+
+    def launch():
+        tpl = pending.pop(0)
+        running[tpl] = time.perf_counter()
+        threading.Thread(target=attempt, args=(tpl, tpl.format(year=year)), daemon=True).start()
+
+    winner = None
+    if not pending:
+        return None
+    launch()
+    while running and winner is None:
+        hedging = pending and not (answered & running.keys())
+        try:
+            tpl, kind, value = results.get(timeout=hedge_s if hedging else None)
+        except queue.Empty:             # nobody answered within the hedge delay: start the next mirror too
+            launch()
+            continue
+        if kind == "headers":
+            if value in (200, 304):
+                answered.add(tpl)
+            continue
+        url, ms = tpl.format(year=year), (time.perf_counter() - running.pop(tpl)) * 1000
+        note_latency(stats, tpl, ms, ok=kind == "done")
+        if kind == "done":
+            winner = (url,) + value
+        else:
+            print(f"[WARN] Fetch failed from {url}: {value}")
+            if pending:
+                launch()
+    cancel.set()                        # losers still in flight stop downloading
+    save_mirror_stats(stats, stats_path)
+    return winner
+
+
+def without(candidates, url, year):
+    """candidates minus the mirror that served url."""
+    return [c for c in candidates if c.format(year=year) != url]
+
+
+def load_any(year, candidates=CANDIDATES, skip=None):
+    """(url, DataFrame, asset meta, changed) from the first mirror whose file
+    parses; None if they all fail. A corrupt file is dropped from the asset
+    store and the other mirrors are tried.
+
+    skip(url, meta, changed), if given, is asked before parsing; when it
+    says True the DataFrame is None (nothing new to read).
+    """
+    import pandas as pd
+    from fantasyfootball.data import assets
+
+    candidates = list(candidates)
+    while candidates:
+        got = download_any(year, candidates)
+        if got is None:
+            return None
+        url, body, meta, changed = got
+        if skip is not None and skip(url, meta, changed):
+            return url, None, meta, changed
+        try:
+            return url, pd.read_csv(io.BytesIO(body), compression="gzip"), meta, changed
+        except Exception as e:      # corrupt / not gzip: try the other mirrors
+            print(f"[WARN] Unreadable file from {url}: {e}")
+            assets.forget(url)
+            candidates = without(candidates, url, year)
+    return None
+
+
+def _concat(chunks, columns, schema):
+    """pd.concat that keeps categoricals categorical when chunks saw different values."""
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+
+    if not chunks:
+        return pd.DataFrame({c: pd.Series(dtype=schema[c]) for c in columns})
+    cats = [c for c in columns if isinstance(chunks[0][c].dtype, pd.CategoricalDtype)]
+    df = pd.concat([ch.drop(columns=cats) for ch in chunks], ignore_index=True)
+    for c in cats:
+        df[c] = union_categoricals([ch[c] for ch in chunks])
+    return df[columns]
+
+
+def read_weekly(source, seasons=None, compression="gzip", chunksize=CHUNK_ROWS, schema=WEEKLY_SCHEMA):
+    """A players_weekly CSV (path or file object) projected onto `schema`'s
+    columns with its dtypes.
+
+    Read `chunksize` rows at a time, keeping only `seasons` (all if None) from
+    each chunk, so memory follows the rows kept rather than the file size.
+    Columns of the schema missing from the file are simply absent.
+    """
+    import pandas as pd
+
+    kept, columns = [], None
+    with pd.read_csv(source, compression=compression, usecols=lambda c: c in schema,
+                     dtype=schema, chunksize=chunksize) as reader:
+        for chunk in reader:
+            columns = list(chunk.columns)
+            if seasons is not None and "season" in chunk.columns:
+                chunk = chunk[chunk["season"].isin(seasons)]
+            if len(chunk):
+                kept.append(chunk)
+    return _concat(kept, columns or [], schema)
+
+
+def _ingest_season(body, season, root):
+    """Process-pool worker: decompress and parse one season into the store."""
+    from fantasyfootball.data import store
+    df = read_weekly(io.BytesIO(body), seasons=[season])
+    return len(df), store.write(df, root)
+
+
+def ingest_seasons(seasons, root, download_workers=4, parse_workers=None, url=WEEKLY_URL):
+    """Load several seasons of players_weekly into the partitioned store at root.
+
+    Downloads (conditional GETs, see assets.fetch) run on threads; each file
+    is handed to a process pool to parse as soon as it arrives, so the total
+    is close to the slowest season rather than the sum. A season whose asset
+    is unchanged and already in the store is not parsed again. A season that
+    fails is reported and skipped. Returns {season: (status, rows, partitions written)}.
+    """
+    import multiprocessing
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+    from fantasyfootball.data import assets, store
+
+    have = {s for s, _ in store.partitions(root)}
+    results = {}
+    # spawn, not fork: the pipeline calls this from a thread of a threaded process
+    ctx = multiprocessing.get_context("spawn")
+    with ThreadPoolExecutor(max_workers=download_workers) as dl, \
+            ProcessPoolExecutor(max_workers=parse_workers, mp_context=ctx) as parse:
+        downloads = {dl.submit(assets.fetch, url.format(season=s)): s for s in seasons}
+        parsing = {}
+        for fut in as_completed(downloads):
+            season = downloads[fut]
+            try:
+                body, meta, changed = fut.result()
+            except Exception as e:
+                print(f"[WARN] {season}: download failed: {e}", flush=True)
+                results[season] = ("failed", 0, [])
+                continue
+            if not changed and season in have:
+                print(f"[SKIP] {season}: unchanged ({assets.version(meta)})", flush=True)
+                results[season] = ("unchanged", 0, [])
+                continue
+            parsing[parse.submit(_ingest_season, body, season, str(root))] = season
+        for fut in as_completed(parsing):
+            season = parsing[fut]
+            try:
+                rows, written = fut.result()
+            except Exception as e:
+                print(f"[WARN] {season}: parse failed: {e}", flush=True)
+                results[season] = ("failed", 0, [])
+                continue
+            print(f"[OK] {season}: {rows:,} rows, {len(written)} partition(s) updated", flush=True)
+            results[season] = ("ok", rows, written)
+    return dict(sorted(results.items()))
@@ -0,0 +1,128 @@
+# src/fantasyfootball/data/store.py
+# Player-week stats as a Parquet dataset partitioned by season and week:
+#
+#   data/processed/player_weeks/season=2025/week=3/part.parquet
+#
+# Writers touch only the partitions whose rows changed; readers prune whole
+# seasons/weeks from the directory names and push the position filter down
+# into the Parquet scan, so old seasons are never parsed. Needs pyarrow
+# (optional: check available() first).
+
+import os, hashlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+STORE_DIR = PROJECT_ROOT / "data" / "processed" / "player_weeks"
+PART_NAME = "part.parquet"
+DIGEST_KEY = b"ff_sha256"
+
+
+def available():
+    try:
+        import pyarrow.dataset  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def partition_path(root, season, week):
+    return Path(root) / f"season={int(season)}" / f"week={int(week)}" / PART_NAME
+
+
+def _partitioning():
+    import pyarrow as pa, pyarrow.dataset as ds
+    return ds.partitioning(pa.schema([("season", pa.int16()), ("week", pa.int8())]), flavor="hive")
+
+
+def _digest(df):
+    import pandas as pd
+    h = hashlib.sha256(",".join(map(str, df.columns)).encode("utf-8"))
+    h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
+def stored_digest(path):
+    """Content digest saved in a partition's footer, or None (no file / not ours)."""
+    import pyarrow.parquet as pq
+    try:
+        meta = pq.read_schema(path).metadata or {}
+    except (OSError, ValueError):
+        return None
+    value = meta.get(DIGEST_KEY)
+    return value.decode("ascii") if value else None
+
+
+def write_partition(df, root, season, week):
+    """Write one (season, week) partition unless it already holds these rows.
+
+    df carries no season/week columns (they live in the path). Returns True
+    if the file was (re)written.
+    """
+    import pyarrow as pa, pyarrow.parquet as pq
+
+    df = df.reset_index(drop=True)
+    path = partition_path(root, season, week)
+    digest = _digest(df)
+    if stored_digest(path) == digest:
+        return False
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), DIGEST_KEY: digest.encode("ascii")})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name("." + path.name + ".tmp")     # dot prefix: datasets skip it
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+    return True
+
+
+def write(df, root=STORE_DIR):
+    """Split df by its season/week columns into partitions; returns the
+    sorted (season, week) pairs actually rewritten. Positions are stored
+    upper-case, so a pushed-down position filter matches the way the CSV
+    readers compare them."""
+    import pandas as pd
+
+    if "position" in df.columns:
+        upper = df["position"].str.upper()
+        if isinstance(df["position"].dtype, pd.CategoricalDtype):
+            upper = upper.astype("category")
+        df = df.assign(position=upper)
+    written = []
+    for (season, week), part in df.groupby(["season", "week"], sort=True, observed=True):
+        if write_partition(part.drop(columns=["season", "week"]), root, season, week):
+            written.append((int(season), int(week)))
+    return written
+
+
+def partitions(root=STORE_DIR):
+    """Sorted (season, week) pairs present in the store (directory names only)."""
+    out = []
+    for p in Path(root).glob(f"season=*/week=*/{PART_NAME}"):
+        try:
+            out.append((int(p.parent.parent.name.split("=", 1)[1]), int(p.parent.name.split("=", 1)[1])))
+        except ValueError:
+            continue
+    return sorted(out)
+
+
+def read(root=STORE_DIR, seasons=None, weeks=None, positions=None, columns=None):
+    """Rows from the store as a DataFrame, with season and week columns.
+
+    seasons/weeks prune partitions by path; positions is pushed down into
+    the scan. columns projects (season/week are always included).
+    """
+    import pyarrow.dataset as ds
+
+    root = Path(root)
+    if not any(root.glob(f"season=*/week=*/{PART_NAME}")):
+        import pandas as pd
+        return pd.DataFrame(columns=list(columns or []) + ["season", "week"])
+    dataset = ds.dataset(root, format="parquet", partitioning=_partitioning())
+    flt = None
+    for name, values in (("season", seasons), ("week", weeks), ("position", positions)):
+        if values is not None:
+            cond = ds.field(name).isin(list(values))
+            flt = cond if flt is None else flt & cond
+    if columns is not None:
+        columns = [c for c in columns if c not in ("season", "week")] + ["season", "week"]
+    df = dataset.to_table(columns=columns, filter=flt).to_pandas()
+    return df.sort_values(["season", "week"], kind="stable", ignore_index=True)
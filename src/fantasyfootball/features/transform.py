@@ -0,0 +1,122 @@
+# src/fantasyfootball/features/transform.py
+# DataFrame-in, DataFrame-out versions of the transform steps, so the
+# pipeline and notebooks can chain them without a CSV round-trip.
+
+import pandas as pd
+
+ALLOWED_POS = {"QB", "RB", "WR", "TE", "K", "DST"}
+WEEKLY_COLS = ["season", "week", "player", "team", "position", "ppr_points", "ppr_avg"]
+
+
+def clean_columns(df):
+    """Lowercase, underscore-separated column names (in place; returns df)."""
+    df.columns = (
+        df.columns.str.strip()
+                  .str.lower()
+                  .str.replace(r"[^0-9a-zA-Z]+", "_", regex=True)
+                  .str.strip("_")
+    )
+    return df
+
+
+def clean_teams(df):
+    """Clean team standings and add games_played / win_pct."""
+    teams = clean_columns(df.copy())
+    for col in ["wins", "losses", "ties"]:
+        if col not in teams.columns:
+            teams[col] = 0
+    teams["games_played"] = teams[["wins", "losses", "ties"]].sum(axis=1)
+    teams["win_pct"] = teams["wins"] / teams["games_played"].where(teams["games_played"] != 0, 1)
+    return teams
+
+
+def clean_scoreboard(df):
+    """Clean the scoreboard and add total_points per matchup."""
+    sb = clean_columns(df.copy())
+    if all(c in sb.columns for c in ["home_score", "away_score"]):
+        sb["total_points"] = sb["home_score"] + sb["away_score"]
+    return sb
+
+
+def build_master(teams, sb):
+    """Lightweight "master": a tagged union of the cleaned tables."""
+    t1 = teams.copy(); t1["table"] = "teams"
+    t2 = sb.copy();    t2["table"] = "scoreboard"
+    return pd.concat([t1, t2], ignore_index=True, sort=False)
+
+
+def normalize_player_stats(df, season):
+    """Map an nflverse player_stats frame onto player/position/team/week + ppr_avg.
+
+    Returns None when the schema doesn't have the columns we need.
+    """
+    df = df.copy()
+    df.columns = [c.lower() for c in df.columns]
+
+    # Best-effort mappings across nflverse schemas
+    name_col = "player_name" if "player_name" in df.columns else ("name" if "name" in df.columns else None)
+    pos_col  = "position" if "position" in df.columns else None
+    team_col = "recent_team" if "recent_team" in df.columns else ("team" if "team" in df.columns else None)
+    wk_col   = "week" if "week" in df.columns else None
+    gp_col   = "games" if "games" in df.columns else ("games_played" if "games_played" in df.columns else None)
+    ppr_col  = "fantasy_points_ppr" if "fantasy_points_ppr" in df.columns else None
+    if not all([name_col, pos_col, team_col, wk_col, ppr_col]):
+        return None
+
+    df = df.rename(columns={name_col: "player", pos_col: "position", team_col: "team", wk_col: "week"})
+    df["season"] = season
+
+    # Filter allowed fantasy positions (including DST)
+    df = df[df["position"].isin(ALLOWED_POS)].copy()
+
+    # fallback: treat one game per row if gp missing
+    gp = df[gp_col].clip(lower=1) if gp_col else 1
+    df["ppr_points"] = df[ppr_col]
+    df["ppr_avg"] = df["ppr_points"] / gp
+    return df
+
+
+def build_players_weekly(df):
+    return df[WEEKLY_COLS]
+
+
+def build_top_by_position(df):
+    """Player-level mean ppr_avg, best first within each position."""
+    return (df.groupby(["position", "player"], as_index=False)["ppr_avg"].mean()
+              .sort_values(["position", "ppr_avg"], ascending=[True, False]))
+
+
+def build_top_dst(df):
+    dst = df[df["position"] == "DST"]
+    return dst.groupby(["player"], as_index=False)["ppr_avg"].mean().sort_values("ppr_avg", ascending=False)
+
+
+def empty_templates():
+    """Header-only frames so Power BI can be wired even offline."""
+    return {
+        "players_weekly": pd.DataFrame(columns=WEEKLY_COLS),
+        "top_by_position": pd.DataFrame(columns=["position", "player", "ppr_avg"]),
+        "top_dst": pd.DataFrame(columns=["player", "ppr_avg"]),
+    }
+
+
+def write_transform_outputs(out_dir, teams, sb, master):
+    """Write the cleaned tables + master; returns the paths written.
+
+    Parquet is optional, so a missing pyarrow/fastparquet just means CSV only.
+    """
+    from pathlib import Path
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, df in [("espn_teams_clean.csv", teams), ("espn_scoreboard_clean.csv", sb),
+                     ("espn_master.csv", master)]:
+        df.to_csv(out_dir / name, index=False)
+        written.append(out_dir / name)
+    try:
+        master.to_parquet(out_dir / "espn_master.parquet", index=False)
+        written.append(out_dir / "espn_master.parquet")
+    except Exception:
+        pass
+    return written
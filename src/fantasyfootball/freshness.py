@@ -0,0 +1,167 @@
+# src/fantasyfootball/freshness.py
+# Freshness index for the processed outputs. Whoever writes an output records
+# where it came from, the upstream version (e.g. a release file's hash),
+# the seasons/weeks it covers and a content hash. Health checks then answer
+# "is week N present and current?" from the index instead of trusting
+# LastWriteTime, which OneDrive sync touches.
+#
+# One small JSON per output under <processed>/_freshness/ so concurrent steps
+# (threads or processes) never overwrite each other's entries.
+
+import os, json, time, hashlib
+from datetime import datetime
+from pathlib import Path
+
+INDEX_DIRNAME = "_freshness"
+
+
+def _index_dir(path):
+    return Path(path).parent / INDEX_DIRNAME
+
+
+def _entry_path(path):
+    return _index_dir(path) / (Path(path).name + ".json")
+
+
+def file_digest(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _covered(df, col):
+    if df is None or col not in df.columns:
+        return None
+    out = set()
+    for v in df[col].dropna().unique():
+        try:
+            out.add(int(v))
+        except (TypeError, ValueError):
+            pass
+    return sorted(out)
+
+
+def record(path, source, df=None, version=None, seasons=None, weeks=None, written_at=None):
+    """Index a just-written output. seasons/weeks default to df's season/week columns.
+
+    written_at ({season: {week: the league's current week then}}) is for
+    outputs that can hold a week from before it was final.
+    """
+    path = Path(path)
+    st = path.stat()
+    entry = {
+        "file": path.name,
+        "source": source,
+        "version": version,
+        "seasons": seasons if seasons is not None else _covered(df, "season"),
+        "weeks": weeks if weeks is not None else _covered(df, "week"),
+        "written_at": written_at,
+        "rows": len(df) if df is not None else None,
+        "sha256": file_digest(path),
+        "size": st.st_size,
+        "mtime": st.st_mtime,
+        "fetched_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    out = _entry_path(path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+    os.replace(tmp, out)
+    return entry
+
+
+def load(folder):
+    """{file name: entry} for everything indexed in folder."""
+    entries = {}
+    idx = Path(folder) / INDEX_DIRNAME
+    if idx.is_dir():
+        for p in idx.glob("*.json"):
+            try:
+                e = json.loads(p.read_text(encoding="utf-8"))
+                entries[e["file"]] = e
+            except (ValueError, KeyError):
+                continue
+    return entries
+
+
+def entry_for(path):
+    """The index entry for one file, or None."""
+    try:
+        return json.loads(_entry_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def current(path, source, version):
+    """Is path indexed as written from this source at this upstream version,
+    and still that file? Then a fetch can leave it alone."""
+    entry = entry_for(path)
+    return (entry is not None and version is not None and entry["source"] == source
+            and entry["version"] == version and verify(Path(path).parent, entry))
+
+
+def confirm(path):
+    """Upstream was checked and hasn't changed: bump fetched_at only. The file
+    is not rewritten, so downstream steps see identical inputs and skip."""
+    entry = entry_for(path)
+    if entry is None:
+        return None
+    entry["fetched_at"] = datetime.now().isoformat(timespec="seconds")
+    out = _entry_path(path)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+    os.replace(tmp, out)
+    return entry
+
+
+def verify(folder, entry):
+    """True if the file on disk is still the one that was indexed.
+
+    Size is checked first; the file is only re-hashed when its mtime moved
+    (e.g. a sync touch), so the usual case never opens the file.
+    """
+    p = Path(folder) / entry["file"]
+    try:
+        st = p.stat()
+    except OSError:
+        return False
+    if st.st_size != entry["size"]:
+        return False
+    if st.st_mtime == entry["mtime"]:
+        return True
+    return file_digest(p) == entry["sha256"]
+
+
+def age_days(entry, now=None):
+    fetched = datetime.fromisoformat(entry["fetched_at"]).timestamp()
+    return ((now or time.time()) - fetched) / 86400
+
+
+def has_week(entry, week, season=None):
+    if season is not None and entry.get("seasons") and season not in entry["seasons"]:
+        return False
+    return bool(entry.get("weeks")) and week in entry["weeks"]
+
+
+def alias(folder, target, stable):
+    """Index `stable` as the same content as `target` (after linking it)."""
+    return copy_entry(Path(folder) / target, Path(folder) / stable)
+
+
+def copy_entry(src, dst):
+    """Index file dst (a link to or copy of src, maybe in another folder) with src's entry."""
+    src, dst = Path(src), Path(dst)
+    entry_src = _entry_path(src)
+    if not entry_src.exists():
+        return None
+    entry = json.loads(entry_src.read_text(encoding="utf-8"))
+    st = dst.stat()
+    entry.update(file=dst.name, size=st.st_size, mtime=st.st_mtime)
+    out = _entry_path(dst)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+    os.replace(tmp, out)
+    return entry
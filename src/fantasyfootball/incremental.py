@@ -0,0 +1,116 @@
+# src/fantasyfootball/incremental.py
+# Make-style skip logic for the pipeline: a step is fingerprinted from the
+# bytes of its input files, its script (plus the library modules it imports)
+# and the src/config.py values, and is skipped when that fingerprint matches
+# the last successful run.
+
+import os, ast, glob, json, hashlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+STATE_FILE = PROJECT_ROOT / "data" / "interim" / "pipeline_state.json"
+
+
+def file_digest(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _module_file(name, src):
+    """src-relative file for a dotted module name, or None if it isn't ours."""
+    base = src.joinpath(*name.split("."))
+    for p in (base.with_suffix(".py"), base / "__init__.py"):
+        if p.is_file():
+            return p
+    return None
+
+
+def library_modules(script, root=PROJECT_ROOT):
+    """Project-relative paths of the fantasyfootball modules a script
+    imports, directly or through each other, so a change to any of them
+    invalidates the step."""
+    src = Path(root) / "src"
+    seen, todo = set(), [Path(root) / script]
+    while todo:
+        path = todo.pop()
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            continue
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names += [a.name for a in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                names += [node.module] + [f"{node.module}.{a.name}" for a in node.names]
+        for name in names:
+            if name.split(".")[0] != "fantasyfootball":
+                continue
+            p = _module_file(name, src)
+            if p is not None and p not in seen:
+                seen.add(p)
+                todo.append(p)
+    return sorted(p.relative_to(root).as_posix() for p in seen)
+
+
+def config_values():
+    import config
+    return {k: getattr(config, k) for k in sorted(dir(config)) if k.isupper()}
+
+
+def fingerprint(step):
+    """Hash of everything a step reads; None for steps with no declared inputs.
+
+    Steps without inputs (the fetches) read from the network, so there is
+    nothing local to compare and they always run.
+    """
+    if not step.inputs:
+        return None
+    h = hashlib.sha256()
+    code = sorted(set(step.code) | set(library_modules(step.script)))
+    for rel in (step.script,) + tuple(code) + tuple(step.inputs):
+        if any(c in rel for c in "*?["):
+            # os.path.join, not Path.glob: FF_DATA_DIR may make rel absolute
+            for p in sorted(glob.glob(os.path.join(PROJECT_ROOT, rel))):
+                h.update(os.path.relpath(p, PROJECT_ROOT).encode())
+                h.update(file_digest(p).encode())
+            continue
+        p = PROJECT_ROOT / rel
+        h.update(rel.encode())
+        h.update(file_digest(p).encode() if p.exists() else b"<missing>")
+    h.update(json.dumps(config_values(), sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def load_state(path=STATE_FILE):
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_FILE):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def skip_reason(step, fp, state):
+    """Why a step must run, or None if it can be skipped."""
+    if fp is None:
+        return "no declared inputs (always runs)"
+    if step.name not in state:
+        return "no previous run recorded"
+    if state[step.name] != fp:
+        return "inputs, code or config changed"
+    # parquet outputs are optional (pyarrow may not be installed)
+    missing = [o for o in step.outputs
+               if not (PROJECT_ROOT / o).exists() and not o.endswith(".parquet")]
+    if missing:
+        return "output missing: " + ", ".join(missing)
+    return None
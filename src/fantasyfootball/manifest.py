@@ -0,0 +1,158 @@
+# src/fantasyfootball/manifest.py
+# Per-run resource manifest for the pipeline: wall time, CPU, peak RSS, bytes
+# and rows of each step's files. One JSON file per run under logs/manifests/;
+# compare() checks the latest run against the ones before it.
+
+import sys, json, time, threading, statistics
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import psutil
+except ImportError:   # pinned in requirements.txt, but don't let it break a run
+    psutil = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MANIFEST_DIR = PROJECT_ROOT / "logs" / "manifests"
+
+
+def _cpu_times():
+    """(user, sys) seconds for the calling thread."""
+    if psutil is not None:
+        tid = threading.get_native_id()
+        for t in psutil.Process().threads():
+            if t.id == tid:
+                return t.user_time, t.system_time
+    return time.thread_time(), 0.0
+
+
+def _peak_rss():
+    """Process high-water RSS in bytes (shared by steps running in threads)."""
+    if psutil is not None:
+        mem = psutil.Process().memory_info()
+        if hasattr(mem, "peak_wset"):       # Windows
+            return mem.peak_wset
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        return psutil.Process().memory_info().rss if psutil else None
+
+
+def _io_counters():
+    try:
+        io = psutil.Process().io_counters()
+        return io.read_bytes, io.write_bytes
+    except Exception:    # no psutil, or not supported on this platform (macOS)
+        return None
+
+
+def measure(func, *args):
+    """Call func(*args) and return (result, metrics). Runs inside the worker.
+
+    CPU is per thread, so it stays accurate when steps overlap; peak RSS and
+    the OS io counters are process-wide.
+    """
+    io0, (u0, s0), t0 = _io_counters(), _cpu_times(), time.perf_counter()
+    result = func(*args)
+    wall, (u1, s1), io1 = time.perf_counter() - t0, _cpu_times(), _io_counters()
+    peak = _peak_rss()
+    metrics = {
+        "wall_s": round(wall, 3),
+        "cpu_user_s": round(u1 - u0, 3),
+        "cpu_sys_s": round(s1 - s0, 3),
+        "peak_rss_mb": round(peak / 2**20, 1) if peak else None,
+    }
+    if io0 and io1:
+        metrics["io_read_bytes"] = io1[0] - io0[0]
+        metrics["io_write_bytes"] = io1[1] - io0[1]
+    return result, metrics
+
+
+def count_rows(path):
+    """Data rows in a CSV (newline count minus header) or Parquet file."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+            return pq.read_metadata(path).num_rows
+        except Exception:
+            return None
+    lines, last = 0, b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            lines += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        lines += 1
+    return max(lines - 1, 0)
+
+
+def describe_files(paths):
+    """{path: {"bytes", "rows"}} for the files that exist."""
+    out = {}
+    for rel in paths:
+        p = PROJECT_ROOT / rel
+        if p.exists():
+            out[rel] = {"bytes": p.stat().st_size, "rows": count_rows(p)}
+    return out
+
+
+def write_manifest(record, manifest_dir=MANIFEST_DIR):
+    manifest_dir = Path(manifest_dir)
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    path = manifest_dir / f"run_{datetime.now():%Y%m%d-%H%M%S}.json"
+    path.write_text(json.dumps(record, indent=2), encoding="utf-8")
+    return path
+
+
+def load_manifests(manifest_dir=MANIFEST_DIR):
+    """All manifests, oldest first."""
+    runs = []
+    for p in sorted(Path(manifest_dir).glob("run_*.json")):
+        try:
+            runs.append(json.loads(p.read_text(encoding="utf-8")))
+        except ValueError:
+            print(f"[WARN] Unreadable manifest skipped: {p}")
+    return runs
+
+
+# metric -> (relative threshold, absolute floor) before a change counts
+REGRESSION_RULES = {
+    "wall_s": (0.25, 0.5),
+    "cpu_user_s": (0.25, 0.5),
+    "peak_rss_mb": (0.20, 50.0),
+}
+
+
+def compare(manifest_dir=MANIFEST_DIR, last=5):
+    """Compare the newest run against the median of the `last` runs before it.
+
+    Prints a line per step/metric and returns the list of regressions as
+    (step, metric, baseline, latest).
+    """
+    runs = load_manifests(manifest_dir)
+    if len(runs) < 2:
+        print("[INFO] Need at least two manifests to compare.")
+        return []
+    latest, history = runs[-1], runs[-1 - last:-1]
+    print(f"[INFO] Comparing run {latest['started']} against {len(history)} previous run(s)")
+    regressions = []
+    for name, step in latest["steps"].items():
+        if step.get("status") != "ok":
+            continue
+        for metric, (rel, floor) in REGRESSION_RULES.items():
+            base = [r["steps"][name][metric] for r in history
+                    if r["steps"].get(name, {}).get("status") == "ok"
+                    and r["steps"][name].get(metric) is not None]
+            now = step.get(metric)
+            if not base or now is None:
+                continue
+            median = statistics.median(base)
+            flag = now > median * (1 + rel) and now - median > floor
+            print(f"  {'[REGRESSION]' if flag else '[OK]':<12} {name:<24} {metric:<12} "
+                  f"{median:>9.2f} -> {now:>9.2f}")
+            if flag:
+                regressions.append((name, metric, median, now))
+    return regressions
@@ -0,0 +1,184 @@
+# src/fantasyfootball/net.py
+# One shared HTTP client for every fetcher: a keep-alive connection pool
+# (requests.Session), gzip/deflate, bounded retries with jittered backoff, a
+# cap on concurrent requests per host, and per-host byte/latency counters.
+# espn_api does its own requests.get calls; install_espn() routes those
+# through here too. FF_HTTP_RECORD / FF_HTTP_REPLAY switch on record/replay
+# (see replay.py).
+
+import os, json, time, random, threading
+from urllib.parse import urlsplit
+
+TIMEOUT_S = 30
+RETRIES = 3
+BACKOFF_S = 0.5
+MAX_BACKOFF_S = 8.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+PER_HOST = int(os.getenv("FF_HTTP_PER_HOST", "4"))
+# espn_api views served from .../seasons/<year> (not a league URL): the same
+# for every league, and box_scores re-reads the pro schedule every week, so
+# install_espn() fetches each once per process and shares it
+SHARED_ESPN_VIEWS = {"players_wl", "proTeamSchedules_wl"}
+SHARED_TTL_S = 6 * 60 * 60
+
+
+class Client:
+    def __init__(self, per_host=PER_HOST, retries=RETRIES, backoff_s=BACKOFF_S,
+                 timeout_s=TIMEOUT_S, sleep=time.sleep, record_dir=None, replay_url=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(per_host, 1))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        self.per_host, self.retries = per_host, retries
+        self.backoff_s, self.timeout_s, self._sleep = backoff_s, timeout_s, sleep
+        self._lock = threading.Lock()
+        self._slots = {}
+        self.record_dir, self.replay_url = record_dir, replay_url
+        self.stats = {}      # host -> {"requests", "retries", "errors", "bytes", "seconds"}
+
+    def _slot(self, host):
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[host]
+
+    def _count(self, host, nbytes=0, seconds=0.0, retry=False, error=False):
+        with self._lock:
+            s = self.stats.setdefault(host, {"requests": 0, "retries": 0, "errors": 0, "bytes": 0, "seconds": 0.0})
+            s["requests"] += 1
+            s["retries"] += retry
+            s["errors"] += error
+            s["bytes"] += nbytes
+            s["seconds"] += seconds
+
+    def _delay(self, attempt, response=None):
+        retry_after = response is not None and response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), MAX_BACKOFF_S)
+        return random.uniform(0, min(MAX_BACKOFF_S, self.backoff_s * 2 ** attempt))   # full jitter
+
+    def request(self, method, url, **kwargs):
+        """session.request with retries; returns the last response or raises the last error.
+
+        Retries connection errors, timeouts and RETRY_STATUS responses; any
+        other status is returned as is (call raise_for_status yourself).
+        """
+        import requests
+
+        kwargs.setdefault("timeout", self.timeout_s)
+        if self.record_dir or self.replay_url:
+            from fantasyfootball import replay
+            url = requests.Request(method, url, params=kwargs.pop("params", None)).prepare().url
+            key_headers = dict(kwargs.get("headers") or {})
+        host = urlsplit(url).netloc           # the real host, even when replaying
+        target = url
+        if self.replay_url:
+            target = self.replay_url.rstrip("/") + (urlsplit(url).path or "/")
+            kwargs["headers"] = {**key_headers, replay.ORIGINAL_URL_HEADER: url}
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            with self._slot(host):
+                try:
+                    r = self.session.request(method, target, **kwargs)
+                    nbytes = len(r.content) if not kwargs.get("stream") else 0
+                    error = None
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    r, nbytes, error = None, 0, e
+            retry = error is not None or r.status_code in RETRY_STATUS
+            self._count(host, nbytes, time.perf_counter() - start, retry=attempt > 0, error=retry)
+            if not retry:
+                if self.record_dir and r.status_code != 304:
+                    replay.save(self.record_dir, method, url, key_headers, r)
+                return r
+            if attempt == self.retries:
+                if error is not None:
+                    raise error
+                return r
+            if r is not None:
+                r.close()
+            self._sleep(self._delay(attempt, r))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def client():
+    """The process-wide Client (created on first use)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = Client(record_dir=os.getenv("FF_HTTP_RECORD") or None,
+                             replay_url=os.getenv("FF_HTTP_REPLAY") or None)
+        return _client
+
+
+def get(url, **kwargs):
+    return client().get(url, **kwargs)
+
+
+def report():
+    """One [INFO] line per host with what went over the wire so far."""
+    if _client is None:
+        return
+    for host, s in sorted(_client.stats.items()):
+        avg_ms = 1000 * s["seconds"] / s["requests"] if s["requests"] else 0
+        print(f"[INFO] HTTP {host}: {s['requests']} requests, {s['bytes'] / 2**20:.1f} MiB, "
+              f"avg {avg_ms:.0f} ms, {s['retries']} retries, {s['errors']} errors")
+
+
+def _shared_key(url, params, headers):
+    if "/leagues/" in url or "/leagueHistory/" in url or not isinstance(params, dict) \
+            or params.get("view") not in SHARED_ESPN_VIEWS:
+        return None
+    return url, json.dumps(params, sort_keys=True), json.dumps(dict(headers or {}), sort_keys=True)
+
+
+class _RequestsShim:
+    """Stands in for the `requests` module inside espn_api: get/post go through
+    the shared client, everything else (exceptions, ...) is the real module.
+    League-independent views (SHARED_ESPN_VIEWS) are memoized across leagues."""
+
+    def __init__(self, real):
+        self._real = real
+        self._lock = threading.Lock()
+        self._shared = {}       # key -> (fetched at, response)
+        self._key_locks = {}
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        key = _shared_key(url, params, headers)
+        if key is None:
+            return client().get(url, params=params, headers=headers, **kwargs)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:          # concurrent leagues wait for the one download
+            hit = self._shared.get(key)
+            if hit and time.monotonic() - hit[0] < SHARED_TTL_S:
+                return hit[1]
+            r = client().get(url, params=params, headers=headers, **kwargs)
+            if r.status_code == 200:
+                self._shared[key] = (time.monotonic(), r)
+            return r
+
+    def post(self, url, **kwargs):
+        return client().post(url, **kwargs)
+
+
+def install_espn():
+    """Route espn_api's HTTP calls through the shared client (idempotent)."""
+    from espn_api.requests import espn_requests
+    if not isinstance(espn_requests.requests, _RequestsShim):
+        espn_requests.requests = _RequestsShim(espn_requests.requests)
@@ -0,0 +1,235 @@
+# src/fantasyfootball/pipeline.py
+# Declared step graph for run_all.py plus an in-process runner.
+# Each step lists the files it reads and writes; ordering is worked out from
+# that, and steps with nothing in between them (the fetches) run side by side.
+
+import os, sys, traceback, time, fnmatch
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from fantasyfootball import incremental, manifest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = PROJECT_ROOT / "src"
+
+# Step scripts import `config` as a top-level module, same as when run directly.
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@dataclass(frozen=True)
+class Step:
+    name: str
+    script: str          # relative to the project root
+    inputs: tuple = ()   # files or glob patterns
+    outputs: tuple = ()
+    code: tuple = ()     # other files it depends on (fantasyfootball imports are found by incremental)
+
+
+def default_steps():
+    """The weekly refresh graph. Paths are relative to the project root."""
+    from config import DATA_DIR, PLAYERS_WEEKLY_CSV, PLAYER_WEEKS_DIR, TOP_BY_POSITION_CSV, TOP_DST_CSV
+    from fantasyfootball.data.store import PART_NAME
+
+    processed = "data/processed"
+    teams = f"{processed}/espn_teams.csv"
+    sb = f"{processed}/espn_scoreboard.csv"
+    clean = (
+        f"{processed}/espn_teams_clean.csv",
+        f"{processed}/espn_scoreboard_clean.csv",
+        f"{processed}/espn_master.csv",
+        f"{processed}/espn_master.parquet",
+    )
+    return [
+        Step("fetch_espn", "src/fetch_espn.py", outputs=(teams, sb)),
+        Step("fetch_espn_players", "src/fetch_espn_players.py",
+             outputs=(f"{processed}/players_weekly_espn.csv",)),
+        Step("fetch_nflverse", "src/fetch_nflverse.py", outputs=(PLAYERS_WEEKLY_CSV,)),
+        Step("transform_data", "src/transform_data.py", inputs=(teams, sb), outputs=clean),
+        Step("rebuild_support_exports", "src/rebuild_support_exports.py",
+             inputs=(PLAYERS_WEEKLY_CSV, f"{PLAYER_WEEKS_DIR}/season=*/week=*/{PART_NAME}"),
+             outputs=(TOP_BY_POSITION_CSV, TOP_DST_CSV)),
+        Step("copy_to_powerbi", "src/copy_to_powerbi.py", inputs=clean,
+             outputs=tuple("powerbi/data/" + Path(p).name for p in clean)),
+        # after the steps that write stable names directly, so their fresh
+        # outputs are seen (and kept) rather than raced
+        # (team_weekly_*.csv has no producer here, so team_weekly.csv isn't declared)
+        Step("stable_names", "src/refresh_stable_names.py",
+             inputs=(PLAYERS_WEEKLY_CSV, TOP_BY_POSITION_CSV) + tuple(
+                 os.path.join(DATA_DIR, f"{prefix}*.csv")
+                 for prefix in ("players_weekly_", "team_weekly_", "top_by_position_", "top_dst_")),
+             outputs=(PLAYERS_WEEKLY_CSV, TOP_BY_POSITION_CSV, os.path.join(DATA_DIR, "top_dst.csv"))),
+    ]
+
+
+def dependencies(steps):
+    """Map step name -> names of the steps that produce one of its inputs."""
+    producer = {}
+    for s in steps:
+        for out in s.outputs:
+            # a file the step also reads is republished in place (stable
+            # names): readers are ordered by the step that first writes it
+            if any(fnmatch.fnmatch(os.path.normpath(out), os.path.normpath(i)) for i in s.inputs):
+                continue
+            producer[os.path.normpath(out)] = s.name
+    deps = {}
+    for s in steps:
+        deps[s.name] = {
+            name for out, name in producer.items() if name != s.name
+            and any(fnmatch.fnmatch(out, os.path.normpath(i)) for i in s.inputs)
+        }
+    return deps
+
+
+def toposort(steps):
+    """Steps in a valid run order (declaration order where there's a choice)."""
+    deps = dependencies(steps)
+    ordered, done = [], set()
+    remaining = list(steps)
+    while remaining:
+        ready = [s for s in remaining if deps[s.name] <= done]
+        if not ready:
+            raise ValueError("Step graph has a cycle: " + ", ".join(s.name for s in remaining))
+        for s in ready:
+            ordered.append(s)
+            done.add(s.name)
+            remaining.remove(s)
+    return ordered
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)   # sys.exit("message") / raise SystemExit("...")
+    return 1
+
+
+def run_script(script):
+    """Run a step script in this interpreter as __main__; returns its exit code.
+
+    The scripts end in sys.exit, so SystemExit is the normal way out. They're
+    exec'd into a fresh namespace rather than through runpy so that several
+    can run in threads without fighting over sys.modules["__main__"].
+    """
+    path = PROJECT_ROOT / script
+    try:
+        code = compile(path.read_text(encoding="utf-8"), str(path), "exec")
+        exec(code, {"__name__": "__main__", "__file__": str(path), "__builtins__": __builtins__})
+    except SystemExit as e:
+        return _exit_code(e.code)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+def plan_pipeline(steps, force=False, state=None):
+    """Dry run: [(step, "RUN"/"SKIP"/"RUN?", reason)] in run order.
+
+    A step downstream of one that will run is shown as RUN? because whether
+    its inputs actually change is only known once the upstream step is done.
+    """
+    state = incremental.load_state() if state is None else state
+    deps = dependencies(steps)
+    will_run, plan = set(), []
+    for step in toposort(steps):
+        if force:
+            action, reason = "RUN", "forced"
+        elif deps[step.name] & will_run:
+            action, reason = "RUN?", "after " + ", ".join(sorted(deps[step.name] & will_run))
+        else:
+            reason = incremental.skip_reason(step, incremental.fingerprint(step), state)
+            action = "SKIP" if reason is None else "RUN"
+            reason = reason or "unchanged since last run"
+        if action != "SKIP":
+            will_run.add(step.name)
+        plan.append((step, action, reason))
+    return plan
+
+
+def run_pipeline(steps, jobs=4, processes=False, force=False,
+                 state_path=incremental.STATE_FILE, manifest_dir=manifest.MANIFEST_DIR, profile=False):
+    """Run the graph; independent steps overlap up to `jobs` at a time.
+
+    Threads by default (one interpreter, pandas imported once). processes=True
+    uses a process pool instead, for CPU-heavy steps. A step whose fingerprint
+    matches the state file is skipped unless force=True; state_path=None turns
+    that bookkeeping off. Each run writes a resource manifest to manifest_dir
+    (None to skip). profile=True wraps each step in cProfile + tracemalloc
+    (see fantasyfootball.profiling). Stops launching new steps after the
+    first failure and returns that step's exit code.
+    """
+    deps = dependencies(steps)
+    pending = toposort(steps)
+    state = incremental.load_state(state_path) if state_path else {}
+    done, running, fps, rc = set(), {}, {}, 0
+    jobs = max(1, jobs)
+    pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    if profile:
+        from fantasyfootball import profiling
+        if not processes and jobs > 1:
+            # cProfile and tracemalloc are per-process; overlapping threads would blur steps together
+            print("[INFO] Profiling: running steps one at a time", flush=True)
+            jobs = 1
+    record = {"started": datetime.now().isoformat(timespec="seconds"), "jobs": jobs,
+              "processes": processes, "force": force, "steps": {}}
+
+    with pool_cls(max_workers=jobs) as pool:
+        while pending or running:
+            progressed = rc == 0
+            while progressed:
+                progressed = False
+                for step in [s for s in pending if deps[s.name] <= done]:
+                    # inputs are final once the step is ready, so hash them once
+                    if step.name not in fps:
+                        fps[step.name] = incremental.fingerprint(step) if state_path else None
+                    fp = fps[step.name]
+                    if not force and state_path and incremental.skip_reason(step, fp, state) is None:
+                        pending.remove(step)
+                        done.add(step.name)
+                        print(f"[SKIP] {step.name} unchanged since last run", flush=True)
+                        record["steps"][step.name] = {"status": "skipped"}
+                        progressed = True
+                        continue
+                    if len(running) >= jobs:
+                        break
+                    pending.remove(step)
+                    print(f"[RUN] {step.name} -> {step.script}", flush=True)
+                    call = (run_script, step.script)
+                    if profile:
+                        call = (profiling.run_profiled, step.name, profiling.PROFILE_DIR) + call
+                    running[pool.submit(manifest.measure, *call)] = (step, fp, time.perf_counter())
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                step, fp, t0 = running.pop(fut)
+                try:
+                    step_rc, metrics = fut.result()
+                except Exception as e:   # e.g. a dead worker process
+                    print(f"[ERROR] {step.name} crashed: {e}", file=sys.stderr)
+                    step_rc, metrics = 1, {}
+                elapsed = time.perf_counter() - t0
+                record["steps"][step.name] = dict(
+                    status="ok" if step_rc == 0 else "failed", rc=step_rc, **metrics,
+                    inputs=manifest.describe_files(step.inputs),
+                    outputs=manifest.describe_files(step.outputs),
+                )
+                if step_rc == 0:
+                    done.add(step.name)
+                    print(f"[OK]  {step.name} completed in {elapsed:.1f}s", flush=True)
+                    if fp is not None:
+                        state[step.name] = fp
+                        incremental.save_state(state, state_path)
+                else:
+                    print(f"[ERROR] {step.name} failed with errorlevel {step_rc}", flush=True)
+                    rc = rc or step_rc
+
+    record.update(finished=datetime.now().isoformat(timespec="seconds"), rc=rc)
+    if manifest_dir:
+        print(f"[INFO] Manifest: {manifest.write_manifest(record, manifest_dir)}", flush=True)
+    return rc
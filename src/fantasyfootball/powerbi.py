@@ -0,0 +1,31 @@
+# src/fantasyfootball/powerbi.py
+# Copies processed outputs into powerbi/data for easy PBIX binding.
+
+import shutil
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = PROJECT_ROOT / "data" / "processed"
+DST_DIR = PROJECT_ROOT / "powerbi" / "data"
+
+FILES = [
+    "espn_teams_clean.csv",
+    "espn_scoreboard_clean.csv",
+    "espn_master.csv",
+    "espn_master.parquet",   # optional; ignore if missing
+]
+
+
+def copy_outputs(src=SRC_DIR, dst=DST_DIR, files=FILES):
+    """Copy `files` from src to dst; returns (copied, missing) path lists."""
+    src, dst = Path(src), Path(dst)
+    dst.mkdir(parents=True, exist_ok=True)
+    copied, missing = [], []
+    for name in files:
+        s, d = src / name, dst / name
+        if s.exists():
+            shutil.copy2(s, d)
+            copied.append(str(d))
+        else:
+            missing.append(str(s))
+    return copied, missing
@@ -0,0 +1,101 @@
+# src/fantasyfootball/profiling.py
+# Opt-in cProfile + tracemalloc wrapper for pipeline steps. Turned on with
+# FF_PROFILE=1 (or --profile); when off, nothing here is imported or called.
+# Per step it writes <name>.pstats, <name>.alloc.txt (top allocation sites)
+# and <name>.collapsed (flamegraph.pl / speedscope collapsed stacks).
+
+import os, cProfile, pstats, tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+PROFILE_DIR = PROJECT_ROOT / "data" / "processed" / "_profiles"
+TOP_ALLOCATIONS = 25
+
+
+def enabled():
+    return os.getenv("FF_PROFILE", "0") not in ("", "0", "false", "no")
+
+
+def run_profiled(name, out_dir, func, *args):
+    """Call func(*args) under cProfile and tracemalloc; returns func's result."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    prof = cProfile.Profile()
+    tracemalloc.start(10)
+    prof.enable()
+    try:
+        return func(*args)
+    finally:
+        prof.disable()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        prof.dump_stats(out_dir / f"{name}.pstats")
+        write_allocations(snapshot, peak, out_dir / f"{name}.alloc.txt")
+        write_collapsed(pstats.Stats(prof), out_dir / f"{name}.collapsed")
+        print(f"[INFO] Profile for {name} written to {out_dir}", flush=True)
+
+
+def write_allocations(snapshot, peak, path):
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+    lines = [f"peak traced: {peak / 2**20:.1f} MiB", f"top {TOP_ALLOCATIONS} allocation sites (still live at end):", ""]
+    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 2**20:9.2f} MiB  {stat.count:>8} blocks  {frame.filename}:{frame.lineno}")
+    Path(path).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _label(func):
+    filename, lineno, funcname = func
+    if filename == "~":                      # builtins
+        return funcname.replace(";", ",")
+    return f"{funcname} ({os.path.basename(filename)}:{lineno})".replace(";", ",")
+
+
+def collapsed_stacks(stats, max_depth=64, min_us=100):
+    """{"root;child;leaf": microseconds} from a pstats.Stats call graph.
+
+    cProfile keeps caller->callee edges, not full stacks, so a function's
+    self time is split across its call paths in proportion to the time each
+    caller spent in it. Paths carrying less than min_us in total are
+    dropped, which keeps import-machinery recursion from exploding the file.
+    Good enough to see where the time goes.
+    """
+    raw = stats.stats
+    children, incoming = {}, {}
+    for func, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+            incoming[func] = incoming.get(func, 0.0) + edge[3]
+    out = {}
+
+    def visit(func, path, frac):
+        _cc, _nc, tt, ct, _callers = raw[func]
+        path = path + (_label(func),)
+        self_us = tt * frac * 1e6
+        if self_us >= 1:
+            key = ";".join(path)
+            out[key] = out.get(key, 0) + self_us
+        if len(path) >= max_depth:
+            return
+        for child, edge_ct in children.get(func, ()):
+            child_ct = raw[child][3]
+            if child_ct <= 0:
+                continue
+            # share by incoming edge time; recursion makes edges sum past ct
+            child_frac = frac * edge_ct / incoming[child]
+            if child_ct * child_frac * 1e6 >= min_us:
+                visit(child, path, child_frac)
+
+    for func, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        if not callers:
+            visit(func, (), 1.0)
+    return {k: int(v) for k, v in out.items() if int(v) > 0}
+
+
+def write_collapsed(stats, path):
+    stacks = collapsed_stacks(stats)
+    Path(path).write_text("".join(f"{k} {v}\n" for k, v in sorted(stacks.items())), encoding="utf-8")
@@ -0,0 +1,35 @@
+# src/fantasyfootball/ratelimit.py
+# Token bucket shared by worker threads so concurrent ESPN pulls stay under a
+# steady request rate (with a small burst allowance).
+
+import time, threading
+
+
+class TokenBucket:
+    """`rate` tokens per second, at most `burst` saved up. rate <= 0 means no limit."""
+
+    def __init__(self, rate, burst=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, self.rate))
+        self._clock, self._sleep = clock, sleep
+        self._tokens = self.burst
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` are available; returns the seconds waited.
+
+        Tokens are reserved under the lock (the balance may go negative) and
+        the wait happens outside it, so callers are served in arrival order.
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -0,0 +1,109 @@
+# src/fantasyfootball/replay.py
+# Record/replay of the fetchers' HTTP traffic, for offline benchmarks.
+#
+#   FF_HTTP_RECORD=<dir>   the shared net client saves every response it gets
+#   python -m fantasyfootball replay <dir> [--latency-ms 80 --error-rate 0.05]
+#   FF_HTTP_REPLAY=http://127.0.0.1:8765
+#                          the client sends every request to the stand-in,
+#                          with the real URL in the X-FF-Original-URL header
+#
+# A fixture is <dir>/<host>/<key>.json (status, headers) plus <key>.body. The
+# key covers method, full URL and ESPN's x-fantasy-filter header, never the
+# cookies, so fixtures hold no credentials.
+
+import os, json, time, random, hashlib, threading
+from pathlib import Path
+from urllib.parse import urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ORIGINAL_URL_HEADER = "X-FF-Original-URL"
+KEY_HEADERS = ("x-fantasy-filter",)
+KEEP_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+
+def fixture_key(method, url, headers=None):
+    headers = {k.lower(): v for k, v in (headers or {}).items()}
+    parts = [method.upper(), url] + [f"{h}={headers.get(h, '')}" for h in KEY_HEADERS]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:24]
+
+
+def _paths(root, url, key):
+    folder = Path(root) / urlsplit(url).netloc.replace(":", "_")
+    return folder / f"{key}.json", folder / f"{key}.body"
+
+
+_write_lock = threading.Lock()
+
+
+def save(root, method, url, headers, response):
+    """Store one response (body already decoded by requests) as a fixture."""
+    meta_path, body_path = _paths(root, url, fixture_key(method, url, headers))
+    meta = {
+        "method": method.upper(), "url": url, "status": response.status_code,
+        "headers": {h: response.headers[h] for h in KEEP_HEADERS if h in response.headers},
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with _write_lock:
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+        for path, data in ((body_path, response.content), (meta_path, json.dumps(meta, indent=2).encode("utf-8"))):
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+
+def load(root, method, url, headers=None):
+    """(meta, body) for a recorded request, or None."""
+    meta_path, body_path = _paths(root, url, fixture_key(method, url, headers))
+    if not meta_path.exists():
+        return None
+    return json.loads(meta_path.read_text(encoding="utf-8")), body_path.read_bytes()
+
+
+def make_handler(root, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"       # keep-alive, like the real hosts
+
+        def _serve(self):
+            delay = latency_ms + random.uniform(0, jitter_ms)
+            if delay:
+                time.sleep(delay / 1000)
+            url = self.headers.get(ORIGINAL_URL_HEADER)
+            if self.headers.get("Content-Length"):
+                self.rfile.read(int(self.headers["Content-Length"]))
+            if error_rate and random.random() < error_rate:
+                return self._send(503, {"Content-Type": "text/plain"}, b"injected error\n")
+            found = load(root, self.command, url, dict(self.headers.items())) if url else None
+            if found is None:
+                return self._send(404, {"Content-Type": "text/plain"}, f"no fixture for {url}\n".encode("utf-8"))
+            meta, body = found
+            etag = meta["headers"].get("ETag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                return self._send(304, {"ETag": etag}, b"")
+            self._send(meta["status"], meta["headers"], body)
+
+        def _send(self, status, headers, body):
+            self.send_response(status)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _serve
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def serve(root, host="127.0.0.1", port=8765, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0):
+    """Serve fixtures from root until interrupted."""
+    server = ThreadingHTTPServer((host, port), make_handler(root, latency_ms, jitter_ms, error_rate))
+    server.daemon_threads = True
+    print(f"[OK] Replaying {root} on http://{host}:{server.server_port} "
+          f"(latency {latency_ms:g}+{jitter_ms:g} ms, error rate {error_rate:g})", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,140 @@
+# src/fantasyfootball/scheduler.py
+# Game-day daemon: one warm process and one League connection that polls the
+# ESPN scoreboard fast while games are on and backs off otherwise. Files are
+# only rewritten when their content changes, and then only the downstream
+# steps whose inputs changed run (via the incremental pipeline).
+
+import os, sys, time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+OUT_DIR = PROJECT_ROOT / "data" / "processed"
+
+LIVE_S = 60            # scores moved on the last poll
+WINDOW_S = 5 * 60      # inside a game window but nothing moving
+IDLE_S = 60 * 60       # in season, no games on
+OFFSEASON_S = 24 * 60 * 60
+MAX_BACKOFF_S = 30 * 60
+
+# (weekday, start hour, end hour) in US/Eastern; Mon=0 ... Sun=6
+GAME_WINDOWS = [
+    (3, 19, 24),     # Thursday night
+    (6, 9, 24),      # Sunday, incl. London kickoffs
+    (0, 19, 24),     # Monday night
+    (5, 12, 24),     # Saturday (late season only)
+]
+
+
+def _eastern(now):
+    try:
+        from zoneinfo import ZoneInfo
+        return now.astimezone(ZoneInfo("America/New_York"))
+    except Exception:   # no tz database: close enough for picking a poll rate
+        return now.astimezone(timezone(timedelta(hours=-5)))
+
+
+def in_game_window(now):
+    et = _eastern(now)
+    for weekday, start, end in GAME_WINDOWS:
+        if weekday == 5 and et.month not in (12, 1):
+            continue
+        if et.weekday() == weekday and start <= et.hour < end:
+            return True
+    return False
+
+
+def poll_interval(now, changed, season_over=False):
+    """Seconds until the next poll."""
+    if season_over:
+        return OFFSEASON_S
+    if changed:
+        return LIVE_S
+    return WINDOW_S if in_game_window(now) else IDLE_S
+
+
+def _write_if_changed(df, path):
+    """Write df as CSV only if the bytes differ; True if the file changed."""
+    text = df.to_csv(index=False)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+    return True
+
+
+def downstream_steps():
+    """Steps fed (directly or not) by fetch_espn, which the daemon stands in for."""
+    from fantasyfootball.pipeline import default_steps, dependencies
+    steps = default_steps()
+    deps = dependencies(steps)
+    fed = {"fetch_espn"}
+    for s in steps:           # declaration order is already upstream-first
+        if deps[s.name] & fed:
+            fed.add(s.name)
+    return [s for s in steps if s.name in fed and s.name != "fetch_espn"]
+
+
+def run(creds, max_polls=None, sleep=time.sleep):
+    """Poll until interrupted (or for max_polls polls). Returns an exit code."""
+    from fantasyfootball import freshness
+    from fantasyfootball.data import espn
+    from fantasyfootball.pipeline import run_pipeline
+
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    league, polls, failures, last_sb = None, 0, 0, None
+    steps = downstream_steps()
+    history = os.getenv("FF_ESPN_HISTORY", "0") == "1"     # keep fetch_espn's season table
+    source = f"espn:league/{creds['league_id']}/season/{creds['season']}"   # as fetch_espn records
+    while max_polls is None or polls < max_polls:
+        polls += 1
+        now = datetime.now(timezone.utc)
+        try:
+            if league is None:
+                league = espn.connect(creds)
+                print(f"[OK] Connected to ESPN league {creds['league_id']} year {creds['season']}", flush=True)
+            else:
+                # every poll: refresh() is the only thing that moves current_week
+                # on, and a finished week's scores never move to trigger it
+                week = league.current_week
+                league.refresh()
+                if league.current_week != week:
+                    print(f"[INFO] Week {week} -> {league.current_week}", flush=True)
+                    last_sb = None
+            sb = espn.scoreboard_frame(league)
+            moved = last_sb is not None and not sb.equals(last_sb)
+            last_sb = sb
+            teams = espn.teams_frame(league)
+            teams_changed = _write_if_changed(teams, OUT_DIR / "espn_teams.csv")
+            if teams_changed:
+                freshness.record(OUT_DIR / "espn_teams.csv", source, teams, seasons=[creds["season"]],
+                                 weeks=list(range(1, league.current_week + 1)))
+            sb_out = sb
+            if history and (OUT_DIR / "espn_scoreboard.csv").exists():
+                import pandas as pd
+                sb_out = espn.replace_weeks(pd.read_csv(OUT_DIR / "espn_scoreboard.csv"), sb)
+            sb_changed = _write_if_changed(sb_out, OUT_DIR / "espn_scoreboard.csv")
+            if sb_changed:
+                freshness.record(OUT_DIR / "espn_scoreboard.csv", source, sb_out, seasons=[creds["season"]])
+            changed = teams_changed or sb_changed
+            if changed:
+                print(f"[INFO] {now:%H:%M:%S} ESPN data changed; running downstream steps", flush=True)
+                run_pipeline(steps, jobs=1, manifest_dir=None)
+            failures = 0
+            season_over = league.current_week >= league.finalScoringPeriod and not moved \
+                and now.astimezone().month in range(2, 9)
+            wait = poll_interval(now, moved, season_over)
+        except KeyboardInterrupt:
+            raise
+        except Exception as e:
+            failures += 1
+            wait = min(LIVE_S * 2 ** failures, MAX_BACKOFF_S)
+            print(f"[WARN] Poll failed ({e}); retrying in {wait}s", file=sys.stderr, flush=True)
+            if failures >= 3:
+                league = None     # reconnect from scratch next time
+        if max_polls is not None and polls >= max_polls:
+            break
+        print(f"[INFO] Next poll in {wait // 60}m{wait % 60:02d}s", flush=True)
+        sleep(wait)
+    return 0
@@ -0,0 +1,15 @@
+# src/fantasyfootball/seasons.py
+# Season ranges as given on the command line or in FF_*_SEASONS variables.
+
+
+def parse_seasons(text):
+    """"2019-2024" or "2019,2021,2023" -> sorted list of seasons."""
+    seasons = set()
+    for part in text.split(","):
+        part = part.strip()
+        if "-" in part:
+            lo, hi = (int(x) for x in part.split("-", 1))
+            seasons.update(range(lo, hi + 1))
+        elif part:
+            seasons.add(int(part))
+    return sorted(seasons)
@@ -0,0 +1,106 @@
+# src/fantasyfootball/stable_names.py
+# Point the stable file names Power BI binds to (players_weekly.csv, ...) at
+# the newest season-stamped file (players_weekly_2025.csv, ...).
+# One directory scan; publishes by hardlink (or symlink) + atomic os.replace,
+# never by copying the file.
+
+import os, re
+from pathlib import Path
+
+from fantasyfootball import freshness
+
+# stable name -> prefix of the season-stamped files it should point at
+STABLE_NAMES = {
+    "players_weekly.csv":  "players_weekly_",
+    "team_weekly.csv":     "team_weekly_",
+    "top_by_position.csv": "top_by_position_",
+    "top_dst.csv":         "top_dst_",
+}
+YEAR = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+
+
+def newest_by_year(names, prefix):
+    """Newest season-stamped name for prefix: highest year, then name.
+
+    Only names with a 4-digit year after the prefix count, so something like
+    players_weekly_espn.csv is never published as players_weekly.csv. For
+    ranges (top_dst_2021_2025.csv) the last year wins.
+    """
+    best = None
+    for name in names:
+        if not (name.startswith(prefix) and name.endswith(".csv")):
+            continue
+        years = YEAR.findall(name[len(prefix):])
+        if years:
+            key = (int(years[-1]), name)
+            best = key if best is None or key > best else best
+    return best[1] if best else None
+
+
+def publish(target, stable):
+    """Make `stable` the same file as `target` without copying it.
+
+    Links a temp name first and os.replace()s it over the stable name, so
+    readers never see the stable file missing or half-written. Returns the
+    link kind used; raises OSError if the filesystem supports neither.
+    """
+    target, stable = Path(target), Path(stable)
+    tmp = stable.with_name(stable.name + ".tmp")
+    if tmp.exists() or tmp.is_symlink():
+        tmp.unlink()
+    try:
+        os.link(target, tmp)
+        kind = "Hardlink"
+    except OSError:
+        os.symlink(os.path.relpath(target, stable.parent), tmp)    # relative, so the folder can move/sync
+        kind = "Symlink"
+    os.replace(tmp, stable)
+    return kind
+
+
+def write_csv(df, path):
+    """df.to_csv(path) through a temp file + os.replace.
+
+    A plain to_csv opens path with "w" and truncates it in place; when path
+    has been published as a hardlink, that rewrites the season-stamped file
+    it shares an inode with. Replacing the directory entry leaves the old
+    target untouched.
+    """
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    df.to_csv(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def refresh_stable_names(folder, mapping=STABLE_NAMES):
+    """Publish every stable name in folder; returns {stable: target} it points at.
+
+    A stable file that is a plain file newer than the newest stamped file is
+    a direct output of another step (e.g. rebuild_support_exports) and is
+    left alone.
+    """
+    folder = Path(folder)
+    with os.scandir(folder) as it:
+        entries = {e.name: e for e in it if e.is_file()}
+    published = {}
+    for stable_name, prefix in mapping.items():
+        target = newest_by_year(entries, prefix)
+        if target is None:
+            print(f"[WARN] No match for {prefix}*.csv")
+            continue
+        stable, tgt = folder / stable_name, folder / target
+        if stable.exists():
+            if os.path.samefile(stable, tgt):
+                print(f"[OK] {stable_name} -> {target} (unchanged)")
+                published[stable_name] = target
+                continue
+            st = os.stat(stable, follow_symlinks=False)
+            if not stable.is_symlink() and st.st_nlink == 1 \
+                    and st.st_mtime > entries[target].stat().st_mtime:
+                print(f"[INFO] Keeping {stable_name}: newer than {target}")
+                continue
+        kind = publish(tgt, stable)
+        freshness.alias(folder, target, stable_name)
+        print(f"[OK] {kind} {stable_name} -> {target}")
+        published[stable_name] = target
+    return published
@@ -1,111 +1,118 @@
 # src/fetch_espn.py
 # One clean version: loads .env, validates, connects, writes CSVs, and exits with clear codes.
+# Library side is fantasyfootball.data.espn; this is the CLI wrapper.
 
 import os, sys
 from pathlib import Path
 
-# ---- 1) Load .env from project root (…\hello\.env) ----
-try:
-    from dotenv import load_dotenv
-except ImportError:
-    print("[ERROR] python-dotenv not installed in this venv. Run: pip install python-dotenv", file=sys.stderr)
-    sys.exit(1)
-
 PROJECT_ROOT = Path(__file__).resolve().parents[1]          # ...\hello
 ENV_FILE = PROJECT_ROOT / ".env"
-print("[DIAG] .env path:", ENV_FILE)
-
-if not ENV_FILE.exists():
-    print("[ERROR] .env file not found at:", ENV_FILE, file=sys.stderr)
-    sys.exit(1)
-
-load_dotenv(dotenv_path=str(ENV_FILE))
-
-# ---- 2) Read and validate required values ----
-ESPN_S2   = os.getenv("ESPN_S2")
-SWID      = os.getenv("SWID")                # must include {curly braces}
-LEAGUE_ID = os.getenv("LEAGUE_ID")
-SEASON    = os.getenv("SEASON", "2025")
-
-def _mask(v):
-    if not v: return "<missing>"
-    return f"{v[:4]}...{v[-4:]}" if len(v) >= 8 else "<short>"
-
-print("[DIAG] ESPN_S2:", _mask(ESPN_S2))
-print("[DIAG] SWID   :", _mask(SWID))
-print("[DIAG] LEAGUE_ID:", LEAGUE_ID, " SEASON:", SEASON)
-
-problems = []
-if not ESPN_S2: problems.append("ESPN_S2")
-if not SWID or not (SWID.startswith("{") and SWID.endswith("}")):
-    problems.append("SWID (must include curly braces)")
-if not LEAGUE_ID or not LEAGUE_ID.isdigit():
-    problems.append("LEAGUE_ID (digits only)")
-try:
-    int(SEASON)
-except Exception:
-    problems.append("SEASON (must be an integer)")
-
-if problems:
-    print("[ERROR] Missing/invalid env vars:", ", ".join(problems), file=sys.stderr)
-    sys.exit(1)
-
-LEAGUE_ID = int(LEAGUE_ID)
-SEASON    = int(SEASON)
-
-# ---- 3) Ensure output folders exist ----
 OUT_DIR = PROJECT_ROOT / "data" / "processed"
-OUT_DIR.mkdir(parents=True, exist_ok=True)
-
-# ---- 4) Connect to ESPN ----
-try:
-    from espn_api.football import League
-except ImportError:
-    print("[ERROR] espn-api not installed in this venv. Run: pip install espn-api", file=sys.stderr)
-    sys.exit(1)
-
-try:
-    league = League(league_id=LEAGUE_ID, year=SEASON, espn_s2=ESPN_S2, swid=SWID)
-    print(f"[OK] Connected to ESPN league {LEAGUE_ID} year {SEASON}")
-except Exception as e:
-    print("[ERROR] Failed to connect to ESPN League:", e, file=sys.stderr)
-    sys.exit(1)
-
-# ---- 5) Export teams ----
-import pandas as pd
-
-try:
-    teams = league.teams
-    team_rows = [{
-        "team_id": t.team_id,
-        "team_name": t.team_name,
-        "wins": t.wins,
-        "losses": t.losses,
-        "ties": t.ties
-    } for t in teams]
-    (OUT_DIR / "espn_teams.csv").write_text("")  # touch/clear (optional)
-    pd.DataFrame(team_rows).to_csv(OUT_DIR / "espn_teams.csv", index=False)
-    print("[OK] Wrote", OUT_DIR / "espn_teams.csv")
-except Exception as e:
-    print("[ERROR] Writing teams CSV failed:", e, file=sys.stderr)
-    sys.exit(1)
-
-# ---- 6) Export current-week scoreboard ----
-try:
-    scoreboard = league.scoreboard()
-    sb_rows = [{
-        "week": league.current_week,
-        "home_team": m.home_team.team_name,
-        "away_team": m.away_team.team_name,
-        "home_score": m.home_score,
-        "away_score": m.away_score
-    } for m in scoreboard]
-    pd.DataFrame(sb_rows).to_csv(OUT_DIR / "espn_scoreboard.csv", index=False)
-    print("[OK] Wrote", OUT_DIR / "espn_scoreboard.csv")
-except Exception as e:
-    print("[ERROR] Writing scoreboard CSV failed:", e, file=sys.stderr)
-    sys.exit(1)
-
-# ---- 7) All good ----
-print("[DONE] fetch_espn.py completed successfully")
-sys.exit(0)
+# FF_ESPN_HISTORY=1: espn_scoreboard.csv holds every matchup period so far, not just the current one
+HISTORY = os.getenv("FF_ESPN_HISTORY", "0") == "1"
+# With LEAGUE_IDS (comma-separated), leagues fetched at once
+LEAGUE_WORKERS = max(1, int(os.getenv("FF_ESPN_LEAGUE_WORKERS", "4")))
+
+def export_league(creds, out_dir):
+    """Steps 3-5 for one league: connect, write teams + scoreboard to out_dir."""
+    import pandas as pd
+    from fantasyfootball import freshness
+    from fantasyfootball.data import espn, espn_cache
+    from fantasyfootball.stable_names import write_csv
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # ---- 3) Connect to ESPN ----
+    try:
+        league = espn.connect(creds)
+        print(f"[OK] Connected to ESPN league {creds['league_id']} year {creds['season']}")
+    except ImportError:
+        print("[ERROR] espn-api not installed in this venv. Run: pip install espn-api", file=sys.stderr)
+        return 1
+    except Exception as e:
+        print(f"[ERROR] Failed to connect to ESPN league {creds['league_id']}:", e, file=sys.stderr)
+        return 1
+
+    source = f"espn:league/{creds['league_id']}/season/{creds['season']}"
+
+    # ---- 4) Export teams ----
+    try:
+        teams = espn.teams_frame(league)
+        write_csv(teams, out_dir / "espn_teams.csv")    # may be hardlinked to league=<id>/
+        freshness.record(out_dir / "espn_teams.csv", source, teams,
+                         seasons=[creds["season"]], weeks=list(range(1, league.current_week + 1)))
+        print("[OK] Wrote", out_dir / "espn_teams.csv")
+    except Exception as e:
+        print("[ERROR] Writing teams CSV failed:", e, file=sys.stderr)
+        return 1
+
+    # ---- 5) Export scoreboard (history: finished weeks from the cache; the current week is always re-read) ----
+    try:
+        if HISTORY:
+            current = league.currentMatchupPeriod
+            by_week, pulled = espn_cache.cached_many(
+                creds["league_id"], creds["season"], range(1, current + 1), "scoreboard", current,
+                lambda missing: espn.season_scoreboard_rows(league, missing))
+            rows = [r for wk in sorted(by_week) for r in by_week[wk]]
+            print(f"[INFO] Scoreboard weeks 1-{current}; fetched {pulled or 'none'}")
+        else:
+            rows = espn.scoreboard_rows(league, league.current_week)   # open week: never cached
+        sb = pd.DataFrame(rows, columns=espn.SCOREBOARD_COLS)
+        write_csv(sb, out_dir / "espn_scoreboard.csv")
+        freshness.record(out_dir / "espn_scoreboard.csv", source, sb, seasons=[creds["season"]])
+        print("[OK] Wrote", out_dir / "espn_scoreboard.csv")
+    except Exception as e:
+        print("[ERROR] Writing scoreboard CSV failed:", e, file=sys.stderr)
+        return 1
+
+    return 0
+
+def main():
+    from fantasyfootball import net
+    from fantasyfootball.data import espn
+
+    # ---- 1) Load .env + validate required values ----
+    print("[DIAG] .env path:", ENV_FILE)
+    try:
+        creds = espn.load_credentials(ENV_FILE)
+    except ImportError:
+        print("[ERROR] python-dotenv not installed in this venv. Run: pip install python-dotenv", file=sys.stderr)
+        return 1
+    except (FileNotFoundError, ValueError) as e:
+        print("[ERROR]", e, file=sys.stderr)
+        return 1
+    print("[DIAG] ESPN_S2:", espn.mask(creds["espn_s2"]))
+    print("[DIAG] SWID   :", espn.mask(creds["swid"]))
+    print("[DIAG] LEAGUE_ID:", creds["league_id"], " SEASON:", creds["season"],
+          f" LEAGUE_IDS: {creds['league_ids']}" if creds["league_ids"] else "")
+
+    # ---- 2) Ensure output folders exist ----
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # ---- 3-5) One league, or LEAGUE_IDS side by side in data/processed/league=<id>/ ----
+    ids = creds["league_ids"]
+    if not ids:
+        rc = export_league(creds, OUT_DIR)
+        if rc:
+            return rc
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        dirs = {lid: espn.league_dir(OUT_DIR, lid) for lid in ids}
+        with ThreadPoolExecutor(max_workers=min(LEAGUE_WORKERS, len(ids))) as pool:
+            rcs = dict(zip(ids, pool.map(lambda lid: export_league(dict(creds, league_id=lid), dirs[lid]), ids)))
+        primary = creds["league_id"]
+        if rcs[primary] == 0:
+            for name in ("espn_teams.csv", "espn_scoreboard.csv"):
+                espn.publish_primary(dirs[primary] / name, OUT_DIR / name)
+            print(f"[OK] espn_teams.csv / espn_scoreboard.csv -> league={primary}")
+        failed = [lid for lid, rc in rcs.items() if rc]
+        if failed:
+            print(f"[ERROR] {len(failed)} of {len(ids)} leagues failed: {failed}", file=sys.stderr)
+            return 1
+
+    # ---- 6) All good ----
+    net.report()
+    print("[DONE] fetch_espn.py completed successfully")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
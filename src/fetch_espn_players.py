@@ -1,52 +1,145 @@
-import os, csv
+import os, sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
 
+from fantasyfootball import freshness, net
+from fantasyfootball.data import espn, espn_cache
+from fantasyfootball.ratelimit import TokenBucket
+from fantasyfootball.data.espn_players import (
+    week_columns, to_columns, checkpoint_path, write_checkpoint, checkpoint_written_at, iter_rows, completed_weeks,
+    covered_weeks, upsert, RowWriter,
+)
+
 # Defaults (override via env vars when you run it)
 SEASON     = int(os.getenv("FF_ESPN_SEASON", datetime.now().year))
 WEEK_START = int(os.getenv("FF_ESPN_WEEK_START", "1"))
 WEEK_END   = int(os.getenv("FF_ESPN_WEEK_END", "6"))
+# FF_ESPN_RESUME=1: keep finished weeks already checkpointed in data/interim/espn_players
+RESUME     = os.getenv("FF_ESPN_RESUME", "0") == "1"
+# FF_ESPN_INCREMENTAL=1: only fetch weeks missing from the existing output plus
+# the still-open ones (current + last finished), and upsert them into it.
+# Without FF_ESPN_WEEK_END it runs through the league's current week.
+INCREMENTAL = os.getenv("FF_ESPN_INCREMENTAL", "0") == "1"
+# Weeks fetched at once, and max box-score pulls per second across all of them (0 = no limit)
+WORKERS    = max(1, int(os.getenv("FF_ESPN_WORKERS", "4")))
+RATE       = float(os.getenv("FF_ESPN_RATE", "2"))
+# With LEAGUE_IDS (comma-separated), leagues fetched at once
+LEAGUE_WORKERS = max(1, int(os.getenv("FF_ESPN_LEAGUE_WORKERS", "4")))
+# Finished weeks come from data/interim/espn_cache (FF_ESPN_CACHE=0 to always
+# re-download); the last finished week is re-checked after this many hours
+CACHE      = os.getenv("FF_ESPN_CACHE", "1") != "0"
+TTL_HOURS  = float(os.getenv("FF_ESPN_CORRECTION_TTL_HOURS", str(espn_cache.CORRECTION_TTL_HOURS)))
 
 BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 ENV  = os.path.join(BASE, ".env")
-OUT  = os.path.join(BASE, "data", "processed", "players_weekly_espn.csv")
-
-def _get(obj, *names, default=None):
-    """Return the first present attribute among names, else default."""
-    for n in names:
-        if hasattr(obj, n):
-            return getattr(obj, n)
-    return default
-
-def _row_from_lineup_item(li, season, week):
-    # Handle both legacy and newer espn_api attributes
-    name = _get(li, "name", "playerName", default="")
-    team = _get(li, "proTeam", default="") or ""
-    pos  = _get(li, "position", default="") or ""
-    slot = _get(li, "slot_position", default="") or ""
-    pts  = _get(li, "points", "ppr_points", default=0.0) or 0.0
-
-    # Skip bench/IR
-    if str(slot).upper() in ("BE", "IR"):
-        return None
-
-    return {
-        "player": str(name),
-        "team": str(team).upper(),
-        "position": str(pos).upper(),
-        "season": int(season),
-        "week": int(week),
-        "ppr_points": float(pts),
-    }
+# FF_ESPN_PLAYERS_OUT=...parquet streams Parquet row groups instead (needs pyarrow)
+OUT  = os.getenv("FF_ESPN_PLAYERS_OUT") or os.path.join(BASE, "data", "processed", "players_weekly_espn.csv")
+
+def fetch_league(League, league_id, espn_s2, swid, out, limiter, tag=""):
+    """Pull one league's weeks (cached/checkpointed) and stream them to out."""
+    league = League(
+        league_id=int(league_id),
+        year=SEASON,
+        espn_s2=espn_s2,
+        swid=swid,
+    )
+
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    week_end = league.current_week if INCREMENTAL and "FF_ESPN_WEEK_END" not in os.environ else WEEK_END
+    have_out = INCREMENTAL and os.path.exists(out)
+    # {season: {week: current week when written}} from the output's freshness entry
+    entry = freshness.entry_for(out) if have_out else None
+    if entry is None or not freshness.verify(os.path.dirname(out), entry):
+        entry = {}
+    written_at = {s: dict(wks) for s, wks in (entry.get("written_at") or {}).items()}
+    season_at = written_at.setdefault(str(SEASON), {})
+    if INCREMENTAL:
+        # keep weeks written after their correction window (the week after
+        # them) had passed; anything written earlier may be partial
+        covered = covered_weeks(iter_rows(out), SEASON) if have_out else set()
+        done = {w for w in covered if season_at.get(str(w), 0) > w + 1}
+        if done:
+            print(f"[INFO] {tag}Incremental: weeks {sorted(done)} already in {os.path.basename(out)}")
+    else:
+        done = completed_weeks(league_id, SEASON, league.current_week) if RESUME else set()
+        done = {w for w in done if WEEK_START <= w <= WEEK_END}
+        if done:
+            print(f"[INFO] {tag}Resuming: weeks {sorted(done)} already checkpointed")
+
+    def pull(wk):
+        limiter.acquire()
+        return week_columns(league, SEASON, wk)
+
+    def fetch_week(wk):
+        if CACHE:
+            cols, hit = espn_cache.cached(league_id, SEASON, wk, "box_scores", league.current_week,
+                                          lambda: pull(wk), ttl_hours=TTL_HOURS)
+            if isinstance(cols, list):      # entry cached as row dicts by an older version
+                cols = to_columns(cols)
+        else:
+            cols, hit = pull(wk), False
+        if cols is not None:
+            write_checkpoint(cols, checkpoint_path(league_id, SEASON, wk), league.current_week)
+        return cols, hit
+
+    weeks = [wk for wk in range(WEEK_START, week_end + 1) if wk not in done]
+    total, fetched = 0, set()
+    with ThreadPoolExecutor(max_workers=min(WORKERS, len(weeks) or 1)) as pool:
+        futures = [(wk, pool.submit(fetch_week, wk)) for wk in weeks]
+        # Report in week order whatever order the pulls finish in
+        for wk, fut in futures:
+            try:
+                cols, hit = fut.result()
+            except Exception as e:
+                print(f"[WARN] {tag}week {wk}: {e}; skipping")
+                continue
+
+            if cols is None:
+                print(f"[WARN] {tag}week {wk}: no box scores returned")
+                continue
+
+            fetched.add(wk)
+            total += len(cols["player"])
+            how = "cached" if hit else "pulled"
+            print(f"[OK] {tag}ESPN {how} week {wk}: {total} cumulative rows")
+
+    # Stream the output from the week checkpoints, one week in memory at a time
+    if INCREMENTAL:
+        fresh = (r for wk in sorted(fetched) for r in iter_rows(checkpoint_path(league_id, SEASON, wk)))
+        rows = upsert(iter_rows(out) if have_out else (), fresh, SEASON, fetched)
+    else:
+        # only weeks fetched by this run or resumed: a week that failed just now
+        # must not slip in through a checkpoint left by an earlier run
+        stale = [wk for wk in weeks if wk not in fetched and checkpoint_path(league_id, SEASON, wk).exists()]
+        if stale:
+            print(f"[WARN] {tag}weeks {stale} failed; leaving their old checkpoints out of {os.path.basename(out)}")
+        paths = (checkpoint_path(league_id, SEASON, wk) for wk in sorted(fetched | done))
+        rows = (r for path in paths for r in iter_rows(path))
+    with RowWriter(out) as w:
+        w.write(rows)
+    kept = {wk for s, wk in w.weeks if s == SEASON}
+    for wk in fetched | (set() if INCREMENTAL else done):
+        season_at[str(wk)] = checkpoint_written_at(checkpoint_path(league_id, SEASON, wk))
+    written_at[str(SEASON)] = {k: v for k, v in season_at.items() if int(k) in kept and v is not None}
+    freshness.record(out, f"espn:league/{league_id}/season/{SEASON}/box_scores",
+                     seasons=sorted({s for s, _ in w.weeks}) or [SEASON],
+                     weeks=sorted(kept), written_at=written_at)
+
+    print(f"[OK] {tag}Wrote {out} with {w.rows} rows")
+
 
 def main():
-    # Load .env so we can read LEAGUE_ID / ESPN_S2 / SWID
+    # Load .env so we can read LEAGUE_ID(S) / ESPN_S2 / SWID
     if os.path.exists(ENV):
         load_dotenv(ENV, override=True)
 
-    league_id = os.getenv("LEAGUE_ID")
     espn_s2   = os.getenv("ESPN_S2")
     swid      = os.getenv("SWID")
+    try:
+        league_id, league_ids = espn.parse_league_ids(os.getenv("LEAGUE_ID"), os.getenv("LEAGUE_IDS"))
+    except ValueError as e:
+        raise SystemExit(f"[ERROR] {e}")
 
     if not (league_id and espn_s2 and swid):
         raise SystemExit("[ERROR] Missing LEAGUE_ID/ESPN_S2/SWID in environment or .env at project root")
@@ -55,49 +148,34 @@ def main():
         from espn_api.football import League
     except Exception as e:
         raise SystemExit("[ERROR] espn-api not installed. Run: pip install espn-api python-dotenv") from e
-
-    league = League(
-        league_id=int(league_id),
-        year=SEASON,
-        espn_s2=espn_s2,
-        swid=swid,
-    )
-
-    os.makedirs(os.path.dirname(OUT), exist_ok=True)
-    fieldnames = ["player","team","position","season","week","ppr_points"]
-    rows = []
-
-    for wk in range(WEEK_START, WEEK_END + 1):
-        try:
-            box_scores = league.box_scores(wk)
-        except Exception as e:
-            print(f"[WARN] week {wk}: {e}; skipping")
-            continue
-
-        if not box_scores:
-            print(f"[WARN] week {wk}: no box scores returned")
-            continue
-
-        for bs in box_scores:
-            # Home lineup
-            for li in (getattr(bs, "home_lineup", None) or []):
-                row = _row_from_lineup_item(li, SEASON, wk)
-                if row:
-                    rows.append(row)
-            # Away lineup
-            for li in (getattr(bs, "away_lineup", None) or []):
-                row = _row_from_lineup_item(li, SEASON, wk)
-                if row:
-                    rows.append(row)
-
-        print(f"[OK] ESPN pulled week {wk}: {len(rows)} cumulative rows")
-
-    with open(OUT, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        w.writerows(rows)
-
-    print(f"[OK] Wrote {OUT} with {len(rows)} rows")
+    net.install_espn()
+
+    # one limit for every league and week pulled by this process
+    limiter = TokenBucket(RATE, burst=WORKERS)
+    if not league_ids:
+        fetch_league(League, league_id, espn_s2, swid, OUT, limiter)
+        net.report()
+        return
+
+    # LEAGUE_IDS: each league into data/processed/league=<id>/, side by side
+    out_dir, name = os.path.split(OUT)
+    outs = {lid: os.path.join(espn.league_dir(out_dir, lid), name) for lid in league_ids}
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(LEAGUE_WORKERS, len(league_ids))) as pool:
+        futures = {lid: pool.submit(fetch_league, League, lid, espn_s2, swid, outs[lid], limiter,
+                                    tag=f"league {lid}: ") for lid in league_ids}
+        for lid, fut in futures.items():
+            try:
+                fut.result()
+            except Exception as e:
+                print(f"[ERROR] league {lid}: {e}", file=sys.stderr)
+                failed.append(lid)
+    if league_id not in failed:
+        espn.publish_primary(outs[league_id], OUT)
+        print(f"[OK] {name} -> league={league_id}")
+    net.report()
+    if failed:
+        raise SystemExit(f"[ERROR] {len(failed)} of {len(league_ids)} leagues failed: {failed}")
 
 if __name__ == "__main__":
     main()
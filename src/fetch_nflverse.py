@@ -1,26 +1,62 @@
 #!/usr/bin/env python
-import os, sys, pandas as pd
+import io, os, sys, pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from fantasyfootball import freshness, net
+from fantasyfootball.seasons import parse_seasons
+from fantasyfootball.data import assets, store
+from fantasyfootball.stable_names import write_csv
+from fantasyfootball.data.nflverse import WEEKLY_URL, read_weekly, ingest_seasons
 try:
-    from config import FF_CURRENT_SEASON, DATA_DIR, PLAYERS_WEEKLY_CSV, STRICT_2025_ONLY
+    from config import (
+        FF_CURRENT_SEASON, FF_ALLOWED_SEASONS, DATA_DIR, PLAYERS_WEEKLY_CSV, PLAYER_WEEKS_DIR, STRICT_2025_ONLY
+    )
 except Exception as e:
     print(f"[FATAL] Could not import config: {e}"); sys.exit(1)
-URL = f"https://github.com/nflverse/nflverse-data/releases/download/players/players_weekly_{FF_CURRENT_SEASON}.csv.gz"
-def main():
-    Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
+URL = WEEKLY_URL.format(season=FF_CURRENT_SEASON)
+# past seasons to keep in the player_weeks store, e.g. "2015-2024" (default: FF_ALLOWED_SEASONS)
+SEASONS = os.getenv("FF_NFLVERSE_SEASONS")
+def history_seasons():
+    seasons = parse_seasons(SEASONS) if SEASONS else FF_ALLOWED_SEASONS
+    return [s for s in seasons if s != FF_CURRENT_SEASON]
+def fetch_current():
     print(f"[INFO] Target season: {FF_CURRENT_SEASON}")
     print(f"[INFO] Downloading: {URL}")
     try:
-        df = pd.read_csv(URL, compression="gzip", low_memory=False)
+        body, meta, changed = assets.fetch(URL)    # conditional GET against the local copy
+        version = assets.version(meta)
+        if not changed and freshness.current(PLAYERS_WEEKLY_CSV, URL, version):
+            freshness.confirm(PLAYERS_WEEKLY_CSV)
+            print(f"[SKIP] Upstream unchanged ({version}); kept {PLAYERS_WEEKLY_CSV}")
+            return
+        # only the schema's columns, compact dtypes, season filtered chunk by chunk
+        df = read_weekly(io.BytesIO(body), seasons=[FF_CURRENT_SEASON] if STRICT_2025_ONLY else None)
     except Exception as e:
         print(f"[ERROR] Failed to read weekly data: {e}"); sys.exit(2)
-    season_col = next((c for c in df.columns if c.lower()=="season"), None)
+    season_col = "season" if "season" in df.columns else None
     if season_col is None: print("[ERROR] No 'season' column"); sys.exit(3)
-    if STRICT_2025_ONLY:
-        df = df[df[season_col] == FF_CURRENT_SEASON].copy()
     present = sorted(map(int, pd.unique(df[season_col].dropna())))
     print(f"[OK] Seasons present after filter: {present}")
-    df.to_csv(PLAYERS_WEEKLY_CSV, index=False)
+    write_csv(df, PLAYERS_WEEKLY_CSV)     # never through a published hardlink
+    freshness.record(PLAYERS_WEEKLY_CSV, URL, df, version=version)
     print(f"[OK] Wrote {PLAYERS_WEEKLY_CSV} with {len(df):,} rows at {datetime.now()}")
+    if store.available():
+        written = store.write(df, PLAYER_WEEKS_DIR)     # only weeks whose rows changed
+        print(f"[OK] Updated {len(written)} partition(s) in {PLAYER_WEEKS_DIR}")
+def main():
+    Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
+    history = history_seasons()
+    if history and not store.available():
+        print(f"[WARN] pyarrow not installed; seasons {history} not loaded into {PLAYER_WEEKS_DIR}")
+        history = []
+    # past seasons download and parse in the background while the current one runs
+    with ThreadPoolExecutor(max_workers=1) as bg:
+        past = bg.submit(ingest_seasons, history, PLAYER_WEEKS_DIR) if history else None
+        fetch_current()
+        results = past.result() if past else {}
+    failed = [s for s, (status, _, _) in results.items() if status == "failed"]
+    if failed:
+        print(f"[WARN] Seasons not loaded: {failed} (the rest were)")
+    net.report()
 if __name__ == "__main__": main()
@@ -2,10 +2,13 @@
 import os, sys, pandas as pd
 from pathlib import Path
 from datetime import datetime
+from fantasyfootball import freshness
+from fantasyfootball.data import store
+from fantasyfootball.stable_names import write_csv
 try:
     from config import (
         FF_CURRENT_SEASON, FF_ALLOWED_POS, FF_MAX_WEEKS_CURRENT,
-        DATA_DIR, PLAYERS_WEEKLY_CSV, TOP_BY_POSITION_CSV, TOP_DST_CSV, STRICT_2025_ONLY
+        DATA_DIR, PLAYERS_WEEKLY_CSV, PLAYER_WEEKS_DIR, TOP_BY_POSITION_CSV, TOP_DST_CSV, STRICT_2025_ONLY
     )
 except Exception as e:
     print(f"[FATAL] Could not import config: {e}"); sys.exit(1)
@@ -17,7 +20,14 @@ def main():
     Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
     if not os.path.exists(PLAYERS_WEEKLY_CSV):
         print(f"[ERROR] Missing {PLAYERS_WEEKLY_CSV}. Run fetch_nflverse.py first."); sys.exit(2)
-    df = pd.read_csv(PLAYERS_WEEKLY_CSV, low_memory=False)
+    seasons = [FF_CURRENT_SEASON] if STRICT_2025_ONLY else None
+    in_store = store.available() and any(seasons is None or s in seasons for s, _ in store.partitions(PLAYER_WEEKS_DIR))
+    if in_store:
+        # partitions outside the seasons/weeks are never opened; position is pushed into the scan
+        df = store.read(PLAYER_WEEKS_DIR, seasons=seasons, weeks=range(1, FF_MAX_WEEKS_CURRENT + 1),
+                        positions=[p.upper() for p in FF_ALLOWED_POS])
+    else:
+        df = pd.read_csv(PLAYERS_WEEKLY_CSV, low_memory=False)
     cols = set(df.columns)
     season = first_existing(cols, ["season","Season"])
     week   = first_existing(cols, ["week","Week"])
@@ -39,13 +49,19 @@ def main():
     df = df[df[pos].isin([p.upper() for p in FF_ALLOWED_POS])].copy()
     if ppr is None:
         df["__ppr_points__"] = 0.0; ppr = "__ppr_points__"
+    elif df[ppr].dtype == "float32":
+        # store values are float32: back to the 2-decimal float64s the CSV holds, so sums match
+        df[ppr] = df[ppr].astype("float64").round(4)
     keys = ([pid] if pid else []) + [name, pos, season] + ([team] if team else [])
-    agg = df.groupby(keys, dropna=False)[ppr].agg(ppr_points="sum", games_played="count").reset_index()
+    agg = df.groupby(keys, dropna=False, observed=True)[ppr].agg(ppr_points="sum", games_played="count").reset_index()
     agg["ppr_avg"] = (agg["ppr_points"] / agg["games_played"]).round(2)
     agg = agg.sort_values(["ppr_avg","ppr_points"], ascending=[False, False])
-    agg.to_csv(TOP_BY_POSITION_CSV, index=False)
+    write_csv(agg, TOP_BY_POSITION_CSV)   # never through a published hardlink
+    freshness.record(TOP_BY_POSITION_CSV, "derived:" + os.path.basename(PLAYERS_WEEKLY_CSV), agg,
+                     seasons=sorted(int(s) for s in df[season].dropna().unique()),
+                     weeks=sorted(int(w) for w in df[week].dropna().unique()))
     print(f"[OK] Wrote {TOP_BY_POSITION_CSV} with {len(agg):,} rows at {datetime.now()}")
     if not os.path.exists(TOP_DST_CSV):
-        pd.DataFrame({"note":["placeholder for PBIX stability"],"timestamp":[datetime.now()]}).to_csv(TOP_DST_CSV, index=False)
+        write_csv(pd.DataFrame({"note":["placeholder for PBIX stability"],"timestamp":[datetime.now()]}), TOP_DST_CSV)
         print(f"[SKIP] D/ST not computed (placeholder created): {TOP_DST_CSV}")
 if __name__ == "__main__": main()
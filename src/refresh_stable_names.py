@@ -0,0 +1,22 @@
+# src/refresh_stable_names.py
+# Points players_weekly.csv / team_weekly.csv / top_by_position.csv / top_dst.csv
+# at the newest season-stamped file. Replaces the PowerShell block in run_all.bat.
+
+import sys, argparse
+
+from config import DATA_DIR
+from fantasyfootball.stable_names import refresh_stable_names
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--dir", default=DATA_DIR, help=f"processed folder (default {DATA_DIR})")
+    args = ap.parse_args(argv)
+    try:
+        refresh_stable_names(args.dir)
+    except OSError as e:
+        print("[ERROR] Could not refresh stable names:", e, file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
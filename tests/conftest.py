@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# src/ isn't installed; make `fantasyfootball` and `config` importable like the scripts see them.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+import pytest
+
+from fantasyfootball.data import assets
+
+URL = "https://example.org/players_weekly_2025.csv.gz"
+
+
+def make_get(responses, seen):
+    def get(url, headers=None):
+        seen.append(dict(headers or {}))
+        status, body, hdrs = responses.pop(0)
+        return SimpleNamespace(status_code=status, content=body, headers=hdrs,
+                               raise_for_status=lambda: None)
+    return get
+
+
+def test_fetch_conditional_get(tmp_path):
+    seen = []
+    get = make_get([(200, b"v1", {"ETag": '"a"'}), (304, b"", {}),
+                    (200, b"v1", {"ETag": '"b"'}), (200, b"v2", {"ETag": '"c"'})], seen)
+
+    body, meta, changed = assets.fetch(URL, tmp_path, get)
+    assert (body, changed) == (b"v1", True)
+    v1 = assets.version(meta)
+    assert seen[0] == {}
+
+    body, meta, changed = assets.fetch(URL, tmp_path, get)     # 304: served from the local copy
+    assert (body, changed) == (b"v1", False)
+    assert seen[1] == {"If-None-Match": '"a"'}
+
+    body, meta, changed = assets.fetch(URL, tmp_path, get)     # republished, same bytes
+    assert (body, changed, meta["etag"]) == (b"v1", False, '"b"')
+    assert assets.version(meta) == v1       # same bytes, so outputs made from v1 still count as current
+
+    body, meta, changed = assets.fetch(URL, tmp_path, get)
+    assert (body, changed) == (b"v2", True)
+
+
+def test_fetch_stops_reading_once_cancelled(tmp_path):
+    import threading
+    cancel, closed = threading.Event(), []
+
+    def blocks(size):
+        yield b"part1"
+        cancel.set()                # another mirror won meanwhile
+        yield b"part2"
+
+    def get(url, headers=None, stream=False):
+        return SimpleNamespace(status_code=200, headers={}, iter_content=blocks,
+                               close=lambda: closed.append(url), raise_for_status=lambda: None)
+
+    with pytest.raises(assets.Cancelled):
+        assets.fetch(URL, tmp_path, get, cancel=cancel)
+    assert closed == [URL] and assets.load_meta(URL, tmp_path) is None
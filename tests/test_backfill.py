@@ -0,0 +1,19 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from fantasyfootball.backfill import season_finished, _season_plan, box_score_weeks
+
+
+def test_season_finished_and_plan():
+    now = datetime(2026, 1, 20)
+    assert season_finished(2024, now)
+    assert not season_finished(2025, now)           # playoffs / corrections may still run
+    assert season_finished(2025, datetime(2026, 3, 1))
+
+    past = SimpleNamespace(current_week=18, finalScoringPeriod=17)
+    assert _season_plan(past, 2019) == (17, 19)     # every week counts as final
+
+
+def test_no_box_score_weeks_before_2019():
+    assert list(box_score_weeks(2018, 17)) == []
+    assert list(box_score_weeks(2019, 17)) == list(range(1, 18))
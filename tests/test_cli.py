@@ -0,0 +1,13 @@
+from fantasyfootball.cli import heavy_imports
+
+
+def test_fast_commands_stay_off_heavy_imports():
+    assert heavy_imports(["status"]) == []
+    assert heavy_imports(["--help"]) == []
+
+
+def test_backfill_rejects_an_empty_season_range(capsys, monkeypatch):
+    from fantasyfootball.cli import PROJECT_ROOT, main
+    monkeypatch.chdir(PROJECT_ROOT)         # main() moves there; restored afterwards
+    assert main(["backfill", "2024-2019"]) == 1
+    assert "[ERROR] no seasons in '2024-2019'" in capsys.readouterr().err
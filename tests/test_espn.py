@@ -0,0 +1,11 @@
+import pytest
+
+from fantasyfootball.data.espn import parse_league_ids
+
+
+def test_parse_league_ids():
+    assert parse_league_ids("11") == (11, [])
+    assert parse_league_ids(None, "22, 33") == (22, [22, 33])
+    assert parse_league_ids("33", "22,33") == (33, [33, 22])
+    with pytest.raises(ValueError):
+        parse_league_ids(None, "22,abc")
@@ -0,0 +1,46 @@
+import time
+
+from fantasyfootball.data.espn_cache import cached, cached_many, is_fresh
+
+
+def test_is_fresh_by_week_state():
+    now = time.time()
+    entry = {"week": 3, "current_week": 4, "cached_at": now - 2 * 3600}
+    assert is_fresh(entry, current_week=4, ttl_hours=24, now=now)        # inside TTL
+    assert not is_fresh(entry, current_week=4, ttl_hours=1, now=now)     # correction window expired
+    assert not is_fresh({**entry, "week": 4}, current_week=4, now=now)   # in progress
+    assert is_fresh({**entry, "current_week": 5, "cached_at": 0}, current_week=6, now=now)
+
+
+def test_cached_fetches_once_for_final_week(tmp_path):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return [{"player": "A", "week": 2}]
+
+    rows = [{"player": "A", "week": 2}]
+    assert cached(1, 2025, 2, "box_scores", 6, fetch, root=tmp_path) == (rows, False)
+    assert cached(1, 2025, 2, "box_scores", 6, fetch, root=tmp_path) == (rows, True)
+    assert len(calls) == 1
+    assert cached(1, 2025, 6, "box_scores", 6, lambda: None, root=tmp_path) == (None, False)
+
+
+def test_cached_many_fetches_missing_weeks_in_one_call(tmp_path):
+    calls = []
+
+    def fetch_many(weeks):
+        calls.append(list(weeks))
+        return {w: [{"week": w}] for w in weeks}
+
+    cached_many(1, 2025, range(1, 4), "scoreboard", 3, fetch_many, root=tmp_path)
+    by_week, pulled = cached_many(1, 2025, range(1, 5), "scoreboard", 4, fetch_many, root=tmp_path)
+    assert calls == [[1, 2, 3], [3, 4]]             # week 3 was in progress when cached
+    assert pulled == [3, 4] and sorted(by_week) == [1, 2, 3, 4]
+
+
+def test_week_cached_while_in_progress_is_not_final_after_rollover(tmp_path):
+    assert cached(1, 2025, 3, "box_scores", 3, lambda: ["partial"], root=tmp_path) == (["partial"], False)
+    assert cached(1, 2025, 3, "box_scores", 4, lambda: ["final"], root=tmp_path) == (["final"], False)
+    entry = {"week": 3, "current_week": 3, "cached_at": time.time()}
+    assert not is_fresh(entry, current_week=4)      # an entry written by an older version
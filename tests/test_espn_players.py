@@ -0,0 +1,124 @@
+import pytest
+
+from fantasyfootball.data.espn_players import RowWriter, iter_rows, upsert, week_columns
+
+
+def _row(player, week, pts, season=2025):
+    return {"player": player, "team": "KC", "position": "WR", "season": season, "week": week, "ppr_points": pts}
+
+
+def test_upsert_replaces_refetched_weeks_only():
+    existing = [_row("A", 1, 3.0, season=2024), _row("A", 1, 10.0), _row("A", 2, 5.0), _row("B", 2, 7.0)]
+    fresh = [_row("A", 2, 6.0), _row("C", 3, 1.0)]
+    out = list(upsert(existing, fresh, 2025, weeks=[2, 3]))
+    assert [(r["season"], r["week"], r["player"], r["ppr_points"]) for r in out] == [
+        (2024, 1, "A", 3.0), (2025, 1, "A", 10.0), (2025, 2, "A", 6.0), (2025, 3, "C", 1.0),
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_row_writer_streams_and_renames(tmp_path, suffix):
+    if suffix == ".parquet":
+        pytest.importorskip("pyarrow")
+    path = tmp_path / f"out{suffix}"
+    with RowWriter(path, buffer_rows=2) as w:
+        w.write(_row(p, wk, 1.5) for wk in (1, 2) for p in "ABC")
+        assert not path.exists()
+    assert w.rows == 6 and w.weeks == {(2025, 1), (2025, 2)}
+    rows = list(iter_rows(path))
+    assert len(rows) == 6 and float(rows[-1]["ppr_points"]) == 1.5 and int(rows[-1]["week"]) == 2
+
+
+class _Starter:
+    def __init__(self, name, slot="WR"):
+        self.name, self.proTeam, self.position, self.slot_position, self.points = name, "kc", "wr", slot, 7
+
+
+class _Legacy:
+    def __init__(self, name):
+        self.playerName, self.ppr_points = name, 3.5
+
+
+class _Box:
+    def __init__(self, home, away):
+        self.home_lineup, self.away_lineup = home, away
+
+
+class _League:
+    def box_scores(self, week):
+        return [_Box([_Starter("A"), _Starter("B", slot="BE")], [_Legacy("C")])]
+
+
+def test_week_columns_resolves_attribute_names_per_class():
+    cols = week_columns(_League(), 2025, 4)
+    assert cols == {"player": ["A", "C"], "team": ["KC", ""], "position": ["WR", ""],
+                    "season": [2025, 2025], "week": [4, 4], "ppr_points": [7.0, 3.5]}
+
+
+def test_checkpoint_path_and_completed_weeks(tmp_path):
+    from fantasyfootball.data.espn_players import checkpoint_path, completed_weeks, to_columns, write_checkpoint
+    path = checkpoint_path(111, 2025, 3, root=tmp_path)
+    assert path == tmp_path / "111_2025" / "week_03.csv"
+    assert completed_weeks(111, 2025, 5, root=tmp_path) == set()
+    for wk in (1, 2, 5):
+        write_checkpoint(to_columns([_row("A", wk, 1.0)]), checkpoint_path(111, 2025, wk, root=tmp_path), 5)
+    assert completed_weeks(111, 2025, 5, root=tmp_path) == {1, 2}    # week 5 is still open
+
+
+def test_checkpoint_written_mid_week_is_not_complete_after_rollover(tmp_path):
+    from fantasyfootball.data.espn_players import checkpoint_path, completed_weeks, to_columns, write_checkpoint
+    path = checkpoint_path(111, 2025, 3, root=tmp_path)
+    write_checkpoint(to_columns([_row("A", 3, 1.0)]), path, 3)       # week 3 still being played
+    assert completed_weeks(111, 2025, 6, root=tmp_path) == set()
+    write_checkpoint(to_columns([_row("A", 3, 9.0)]), path, 4)       # re-pulled after it ended
+    assert completed_weeks(111, 2025, 6, root=tmp_path) == {3}
+
+
+def _fetch_league(tmp_path, monkeypatch, resume=False, fail=(), current_week=4, incremental=False):
+    import fetch_espn_players as script
+    from fantasyfootball.data import espn_players
+    from fantasyfootball.ratelimit import TokenBucket
+
+    pulled = []
+
+    class League:
+        def __init__(self, **kw):
+            self.current_week = current_week
+
+        def box_scores(self, week):
+            pulled.append(week)
+            if week in fail:
+                raise RuntimeError("ESPN hiccup")
+            return [_Box([_Starter(f"P{week}")], [])]
+
+    for name in ("checkpoint_path", "completed_weeks"):
+        real = getattr(espn_players, name)
+        monkeypatch.setattr(script, name, lambda *a, real=real: real(*a, root=tmp_path / "ckpt"))
+    for name, value in (("SEASON", 2025), ("WEEK_START", 1), ("WEEK_END", 4), ("RESUME", resume),
+                        ("INCREMENTAL", incremental), ("CACHE", False)):
+        monkeypatch.setattr(script, name, value)
+    monkeypatch.delenv("FF_ESPN_WEEK_END", raising=False)
+    out = tmp_path / "players_weekly_espn.csv"
+    script.fetch_league(League, 111, "s2", "swid", str(out), TokenBucket(0))
+    return pulled, sorted({int(r["week"]) for r in iter_rows(out)})
+
+
+def test_resume_skips_checkpointed_finished_weeks(tmp_path, monkeypatch):
+    _fetch_league(tmp_path, monkeypatch, resume=False)
+    pulled, weeks = _fetch_league(tmp_path, monkeypatch, resume=True)
+    assert sorted(pulled) == [4]                    # weeks 1-3 are final; the current one is re-read
+    assert weeks == [1, 2, 3, 4]
+
+
+def test_failed_week_leaves_its_old_checkpoint_out(tmp_path, monkeypatch):
+    _fetch_league(tmp_path, monkeypatch, resume=False)
+    pulled, weeks = _fetch_league(tmp_path, monkeypatch, resume=False, fail={2})
+    assert sorted(pulled) == [1, 2, 3, 4]
+    assert weeks == [1, 3, 4]
+
+
+def test_incremental_refetches_a_week_written_mid_week(tmp_path, monkeypatch):
+    _fetch_league(tmp_path, monkeypatch, current_week=3, incremental=True)    # week 3 in progress
+    pulled, weeks = _fetch_league(tmp_path, monkeypatch, current_week=5, incremental=True)
+    assert sorted(pulled) == [2, 3, 4, 5]           # only week 1 was past its correction window
+    assert weeks == [1, 2, 3, 4, 5]
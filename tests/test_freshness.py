@@ -0,0 +1,20 @@
+import os
+
+import pandas as pd
+
+from fantasyfootball import freshness
+
+
+def test_index_survives_mtime_touch_but_not_edits(tmp_path):
+    p = tmp_path / "players_weekly.csv"
+    df = pd.DataFrame({"season": [2025, 2025], "week": [1, 2], "player": ["a", "b"]})
+    df.to_csv(p, index=False)
+    freshness.record(p, "test", df)
+    entry = freshness.load(tmp_path)["players_weekly.csv"]
+    assert entry["weeks"] == [1, 2] and entry["seasons"] == [2025]
+    assert freshness.has_week(entry, 2, 2025) and not freshness.has_week(entry, 3)
+
+    os.utime(p, (0, 0))                      # sync client touching the file
+    assert freshness.verify(tmp_path, entry)
+    p.write_text(p.read_text().replace("a", "z"))
+    assert not freshness.verify(tmp_path, entry)
@@ -0,0 +1,21 @@
+import json
+
+from fantasyfootball.manifest import compare, count_rows
+
+
+def _run(tmp_path, name, wall):
+    step = {"status": "ok", "wall_s": wall, "cpu_user_s": 1.0, "peak_rss_mb": 200.0}
+    record = {"started": name, "steps": {"transform_data": step}}
+    (tmp_path / f"run_{name}.json").write_text(json.dumps(record))
+
+
+def test_compare_flags_slower_step(tmp_path):
+    for i, wall in enumerate([2.0, 2.1, 1.9, 4.0]):
+        _run(tmp_path, f"2025101{i}-120000", wall)
+    assert compare(tmp_path, last=3) == [("transform_data", "wall_s", 2.0, 4.0)]
+
+
+def test_count_rows_csv(tmp_path):
+    p = tmp_path / "x.csv"
+    p.write_text("a,b\n1,2\n3,4")
+    assert count_rows(p) == 2
@@ -0,0 +1,52 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from fantasyfootball.net import Client
+
+
+class Flaky(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        Flaky.hits += 1
+        body = b"ok"
+        self.send_response(503 if Flaky.hits == 1 else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_client_retries_and_counts():
+    server = HTTPServer(("127.0.0.1", 0), Flaky)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        c = Client(sleep=lambda s: None)
+        host = f"127.0.0.1:{server.server_port}"
+        r = c.get(f"http://{host}/x")
+        assert r.status_code == 200 and r.content == b"ok"
+        assert c.stats[host]["requests"] == 2
+        assert c.stats[host]["retries"] == 1 and c.stats[host]["bytes"] == 4
+    finally:
+        server.shutdown()
+
+
+def test_espn_shim_shares_league_independent_views(monkeypatch):
+    import requests
+    from fantasyfootball import net
+
+    Flaky.hits = 1          # no injected 503s
+    server = HTTPServer(("127.0.0.1", 0), Flaky)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(net, "_client", Client(sleep=lambda s: None))
+    try:
+        shim = net._RequestsShim(requests)
+        base = f"http://127.0.0.1:{server.server_port}/apis/v3/games/ffl/seasons/2025"
+        for _ in range(3):
+            shim.get(base + "/players", params={"view": "players_wl"})
+            shim.get(base + "/segments/0/leagues/1", params={"view": "mTeam"})
+        assert Flaky.hits == 1 + 1 + 3
+    finally:
+        server.shutdown()
@@ -0,0 +1,101 @@
+import gzip, io
+
+import pytest
+
+from fantasyfootball.data.nflverse import read_weekly
+
+CSV = """player_id,player_name,position,recent_team,season,week,headshot_url,fantasy_points_ppr
+a,A,QB,KC,2024,1,http://x,20.5
+b,B,WR,BUF,2025,1,http://x,11.2
+c,C,RB,DAL,2025,2,http://x,7
+d,D,TE,SF,2025,2,http://x,3.1
+"""
+
+
+def test_read_weekly_projects_and_filters_by_chunk():
+    src = io.BytesIO(gzip.compress(CSV.encode("utf-8")))
+    df = read_weekly(src, seasons=[2025], chunksize=2)
+    assert "headshot_url" not in df.columns
+    assert list(df["player_id"]) == ["b", "c", "d"]
+    assert str(df["week"].dtype) == "int8" and str(df["fantasy_points_ppr"].dtype) == "float32"
+    # categories seen in different chunks are merged, not turned into object
+    assert str(df["recent_team"].dtype) == "category"
+    assert set(df["recent_team"].cat.categories) >= {"BUF", "DAL", "SF"}
+
+
+def test_ingest_seasons_parses_in_processes_and_skips_failures(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow.dataset")
+    from fantasyfootball.data import assets, nflverse, store
+
+    def fake_fetch(url):
+        if "2023" in url:
+            raise OSError("404 Not Found")
+        season = int(url.rsplit("_", 1)[1][:4])
+        body = "season,week,player_id,position\n" + "".join(f"{season},{w},p{w},QB\n" for w in (1, 2))
+        return gzip.compress(body.encode("utf-8")), {"sha256": "x" * 64}, "2024" in url
+
+    monkeypatch.setattr(assets, "fetch", fake_fetch)
+    got = nflverse.ingest_seasons([2022, 2023, 2024], tmp_path, parse_workers=2)
+    assert got[2023][0] == "failed" and got[2024] == ("ok", 2, [(2024, 1), (2024, 2)])
+    assert store.partitions(tmp_path) == [(2022, 1), (2022, 2), (2024, 1), (2024, 2)]
+    # 2022 reports an unchanged asset and is already stored: not parsed again
+    assert nflverse.ingest_seasons([2022], tmp_path)[2022][0] == "unchanged"
+
+
+def test_download_any_hedges_and_remembers_the_fastest_mirror(tmp_path, monkeypatch):
+    import threading, time
+    from fantasyfootball.data import assets, nflverse
+
+    started, cancelled = [], []
+
+    def fake_fetch(url, on_headers=None, cancel=None):
+        started.append(url)
+        if "slow" in url:
+            if cancel.wait(5):              # hangs until the winner cancels it
+                cancelled.append(url)
+                raise assets.Cancelled(url)
+        if "broken" in url:
+            raise OSError("503")
+        on_headers(type("R", (), {"status_code": 200})())
+        if "big" in url:
+            time.sleep(0.3)                 # a long body after a quick status line
+        return b"body", {"sha256": "x" * 64}, True
+
+    monkeypatch.setattr(assets, "fetch", fake_fetch)
+    mirrors = ["https://slow/{year}", "https://broken/{year}", "https://fast/{year}"]
+    stats = tmp_path / "mirrors.json"
+    t0 = time.perf_counter()
+    got = nflverse.download_any(2025, mirrors, hedge_s=0.05, stats_path=stats)
+    assert got[0] == "https://fast/2025" and time.perf_counter() - t0 < 2
+    for _ in range(50):
+        if cancelled:
+            break
+        time.sleep(0.01)
+    assert cancelled == ["https://slow/2025"]
+    measured = nflverse.load_mirror_stats(stats)
+    assert "https://slow/{year}" not in measured     # cancelled: no latency sample
+    ranked = nflverse.rank_mirrors(mirrors, measured)
+    assert ranked[-1] == "https://broken/{year}"
+
+    # answered quickly, body slower than the hedge delay: no second download starts
+    started.clear()
+    got = nflverse.download_any(2025, ["https://big/{year}", "https://fast/{year}"], hedge_s=0.05,
+                                stats_path=tmp_path / "other.json")
+    assert got[0] == "https://big/2025" and started == ["https://big/2025"]
+
+
+def test_load_any_falls_back_when_a_mirror_sends_garbage(tmp_path, monkeypatch):
+    from fantasyfootball.data import assets, nflverse
+
+    forgotten = []
+
+    def fake_fetch(url, on_headers=None, cancel=None):
+        on_headers(type("R", (), {"status_code": 200})())
+        body = b"not gzip" if "bad" in url else gzip.compress(b"player,week\nA,1\n")
+        return body, {"sha256": "x" * 64}, True
+
+    monkeypatch.setattr(assets, "fetch", fake_fetch)
+    monkeypatch.setattr(assets, "forget", forgotten.append)
+    monkeypatch.setattr(nflverse, "MIRROR_STATS", tmp_path / "mirrors.json")
+    url, df, meta, changed = nflverse.load_any(2025, ["https://bad/{year}", "https://good/{year}"])
+    assert url == "https://good/2025" and list(df["player"]) == ["A"] and forgotten == ["https://bad/2025"]
@@ -0,0 +1,65 @@
+import json
+
+from fantasyfootball.pipeline import Step, dependencies, toposort, run_pipeline, default_steps
+
+
+def test_default_graph_orders_fetches_before_transforms():
+    steps = default_steps()
+    deps = dependencies(steps)
+    assert deps["fetch_espn"] == set()
+    assert deps["transform_data"] == {"fetch_espn"}
+    assert deps["rebuild_support_exports"] == {"fetch_nflverse"}
+    assert deps["copy_to_powerbi"] == {"transform_data"}
+    assert deps["stable_names"] == {"fetch_espn_players", "fetch_nflverse", "rebuild_support_exports"}
+    order = [s.name for s in toposort(steps)]
+    assert order.index("transform_data") > order.index("fetch_espn")
+
+
+def test_run_pipeline_in_process(tmp_path):
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    (tmp_path / "make_a.py").write_text(f"open({str(a)!r}, 'w').write('a')\n")
+    (tmp_path / "make_b.py").write_text(
+        f"import sys\nsys.exit(0 if open({str(a)!r}).read() == 'a' else 5)\n"
+    )
+    (tmp_path / "fail.py").write_text("import sys\nsys.exit(3)\n")
+    steps = [
+        Step("b", str(tmp_path / "make_b.py"), inputs=(str(a),), outputs=(str(b),)),
+        Step("a", str(tmp_path / "make_a.py"), outputs=(str(a),)),
+    ]
+    state = tmp_path / "state.json"
+    assert run_pipeline(steps, jobs=2, state_path=state, manifest_dir=tmp_path) == 0
+    (written,) = tmp_path.glob("run_*.json")
+    record = json.loads(written.read_text())
+    assert record["steps"]["a"]["status"] == "ok"
+    assert record["steps"]["b"]["wall_s"] >= 0
+    failing = [Step("f", str(tmp_path / "fail.py"), outputs=(str(a),))] + steps[:1]
+    assert run_pipeline(failing, state_path=None, manifest_dir=None) == 3
+
+
+def test_unchanged_step_is_skipped(tmp_path, capsys):
+    src, out = tmp_path / "in.txt", tmp_path / "out.txt"
+    src.write_text("x")
+    (tmp_path / "copy.py").write_text(
+        f"open({str(out)!r}, 'a').write(open({str(src)!r}).read())\n"
+    )
+    steps = [Step("copy", str(tmp_path / "copy.py"), inputs=(str(src),), outputs=(str(out),))]
+    state = tmp_path / "state.json"
+    for _ in range(2):
+        assert run_pipeline(steps, state_path=state, manifest_dir=None) == 0
+    assert out.read_text() == "x"
+    assert "[SKIP] copy" in capsys.readouterr().out
+    assert run_pipeline(steps, force=True, state_path=state, manifest_dir=None) == 0
+    assert out.read_text() == "xx"
+
+
+def test_fingerprint_follows_absolute_globs_and_imported_modules(tmp_path):
+    from fantasyfootball import incremental
+    assert {"src/fantasyfootball/data/store.py", "src/fantasyfootball/freshness.py",
+            "src/fantasyfootball/stable_names.py"} <= set(incremental.library_modules("src/rebuild_support_exports.py"))
+
+    (tmp_path / "a.csv").write_text("1")
+    (tmp_path / "step.py").write_text("")
+    step = Step("s", str(tmp_path / "step.py"), inputs=(str(tmp_path / "*.csv"),))
+    before = incremental.fingerprint(step)
+    (tmp_path / "b.csv").write_text("2")
+    assert incremental.fingerprint(step) != before
@@ -0,0 +1,16 @@
+import pstats
+
+from fantasyfootball.profiling import run_profiled
+
+
+def _busy(n):
+    return sum(i * i for i in range(n))
+
+
+def test_run_profiled_writes_outputs(tmp_path):
+    assert run_profiled("step", tmp_path, _busy, 200000) == _busy(200000)
+    for ext in ("pstats", "alloc.txt", "collapsed"):
+        assert (tmp_path / f"step.{ext}").exists()
+    pstats.Stats(str(tmp_path / "step.pstats"))
+    lines = (tmp_path / "step.collapsed").read_text().splitlines()
+    assert any("_busy (test_profiling.py" in ln for ln in lines)
@@ -0,0 +1,25 @@
+from fantasyfootball.ratelimit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+    def sleep(self, s):
+        self.t += s
+
+
+def test_token_bucket_spaces_calls_after_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(2, burst=2, clock=clock, sleep=clock.sleep)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == [0.5, 0.5, 0.5]
+    assert clock.t == 1.5
+
+
+def test_token_bucket_unlimited():
+    assert TokenBucket(0).acquire() == 0.0
@@ -0,0 +1,43 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+
+from fantasyfootball.net import Client
+from fantasyfootball.replay import make_handler
+
+
+class Origin(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = f"{self.path}|{self.headers.get('x-fantasy-filter')}".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"127.0.0.1:{server.server_port}"
+
+
+def test_record_then_replay(tmp_path):
+    origin = HTTPServer(("127.0.0.1", 0), Origin)
+    stand_in = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(tmp_path))
+    try:
+        host = _start(origin)
+        url = f"http://{host}/league"
+        rec = Client(record_dir=tmp_path, sleep=lambda s: None)
+        a = rec.get(url, params={"week": 3}, headers={"x-fantasy-filter": "f1"}).content
+        b = rec.get(url, params={"week": 3}, headers={"x-fantasy-filter": "f2"}).content
+        origin.shutdown()
+
+        rep = Client(replay_url=f"http://{_start(stand_in)}", sleep=lambda s: None)
+        assert rep.get(url, params={"week": 3}, headers={"x-fantasy-filter": "f1"}).content == a
+        assert rep.get(url, params={"week": 3}, headers={"x-fantasy-filter": "f2"}).content == b
+        assert rep.get(url, params={"week": 4}).status_code == 404
+        assert host in rep.stats          # counted against the real host
+    finally:
+        stand_in.shutdown()
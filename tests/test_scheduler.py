@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+
+from fantasyfootball.scheduler import poll_interval, downstream_steps, LIVE_S, WINDOW_S, IDLE_S, OFFSEASON_S
+
+SUNDAY_2PM_ET = datetime(2025, 10, 12, 18, 0, tzinfo=timezone.utc)
+TUESDAY_NOON_ET = datetime(2025, 10, 14, 16, 0, tzinfo=timezone.utc)
+
+
+def test_poll_interval_backs_off_outside_live_games():
+    assert poll_interval(SUNDAY_2PM_ET, changed=True) == LIVE_S
+    assert poll_interval(SUNDAY_2PM_ET, changed=False) == WINDOW_S
+    assert poll_interval(TUESDAY_NOON_ET, changed=False) == IDLE_S
+    assert poll_interval(TUESDAY_NOON_ET, changed=False, season_over=True) == OFFSEASON_S
+
+
+def test_downstream_of_espn_only():
+    assert [s.name for s in downstream_steps()] == ["transform_data", "copy_to_powerbi"]
+
+
+def test_run_moves_to_next_week_while_scores_stand_still(tmp_path, monkeypatch):
+    import pandas as pd
+    from fantasyfootball import pipeline, scheduler
+    from fantasyfootball.data import espn
+
+    class League:
+        current_week, finalScoringPeriod, refreshes = 1, 17, 0
+
+        def refresh(self):
+            self.refreshes += 1
+            if self.refreshes == 2:        # ESPN rolls over to week 2 between polls
+                self.current_week = 2
+
+    league, weeks = League(), []
+
+    def scoreboard_frame(lg):
+        weeks.append(lg.current_week)
+        return pd.DataFrame({"week": [lg.current_week], "home_score": [0.0]})   # final, never moves
+
+    monkeypatch.setattr(scheduler, "OUT_DIR", tmp_path)
+    monkeypatch.setattr(espn, "connect", lambda creds: league)
+    monkeypatch.setattr(espn, "scoreboard_frame", scoreboard_frame)
+    monkeypatch.setattr(espn, "teams_frame", lambda lg: pd.DataFrame({"team_id": [1]}))
+    monkeypatch.setattr(pipeline, "run_pipeline", lambda *a, **k: 0)
+    scheduler.run({"league_id": 1, "season": 2025}, max_polls=4, sleep=lambda s: None)
+    assert weeks == [1, 1, 2, 2]
+    from fantasyfootball import freshness
+    for name in ("espn_teams.csv", "espn_scoreboard.csv"):     # rewritten files stay indexed
+        entry = freshness.entry_for(tmp_path / name)
+        assert entry["source"] == "espn:league/1/season/2025" and freshness.verify(tmp_path, entry)
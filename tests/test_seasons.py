@@ -0,0 +1,6 @@
+from fantasyfootball.seasons import parse_seasons
+
+
+def test_parse_seasons():
+    assert parse_seasons("2019-2021") == [2019, 2020, 2021]
+    assert parse_seasons("2023, 2019-2020,2023") == [2019, 2020, 2023]
@@ -0,0 +1,33 @@
+import os
+
+from fantasyfootball.stable_names import newest_by_year, refresh_stable_names
+
+
+def test_newest_by_year_ignores_unstamped_files():
+    names = ["players_weekly_espn.csv", "players_weekly_2024.csv", "players_weekly_2025.csv",
+             "top_dst_2021_2025.csv", "top_dst_2024.csv"]
+    assert newest_by_year(names, "players_weekly_") == "players_weekly_2025.csv"
+    assert newest_by_year(names, "top_dst_") == "top_dst_2021_2025.csv"
+    assert newest_by_year(["players_weekly_espn.csv"], "players_weekly_") is None
+
+
+def test_refresh_links_instead_of_copying(tmp_path):
+    (tmp_path / "top_dst_2024.csv").write_text("old")
+    (tmp_path / "top_dst_2025.csv").write_text("new")
+    (tmp_path / "top_dst.csv").write_text("stale")
+    os.utime(tmp_path / "top_dst.csv", (0, 0))
+    assert refresh_stable_names(tmp_path) == {"top_dst.csv": "top_dst_2025.csv"}
+    assert os.path.samefile(tmp_path / "top_dst.csv", tmp_path / "top_dst_2025.csv")
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_write_csv_replaces_a_published_name_without_touching_its_target(tmp_path):
+    import pandas as pd
+    from fantasyfootball.stable_names import publish, write_csv
+
+    target, stable = tmp_path / "players_weekly_2025.csv", tmp_path / "players_weekly.csv"
+    target.write_text("season\n2025\n")
+    publish(target, stable)
+    write_csv(pd.DataFrame({"season": [2026]}), stable)
+    assert target.read_text() == "season\n2025\n"
+    assert stable.read_text() == "season\n2026\n" and not os.path.samefile(stable, target)
@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from fantasyfootball.data import store
+
+pytest.importorskip("pyarrow.dataset")
+
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=["player_id", "position", "season", "week", "fantasy_points_ppr"])
+
+
+def test_write_only_changed_partitions_and_read_with_filters(tmp_path):
+    df = frame([("a", "QB", 2024, 1, 10.0), ("b", "WR", 2025, 1, 5.0),
+                ("c", "RB", 2025, 2, 7.5), ("d", "K", 2025, 2, 3.0)])
+    assert store.write(df, tmp_path) == [(2024, 1), (2025, 1), (2025, 2)]
+    assert store.write(df, tmp_path) == []          # same rows: nothing rewritten
+
+    df.loc[df["player_id"] == "d", "fantasy_points_ppr"] = 4.0
+    week3 = frame([("e", "TE", 2025, 3, 1.0)])
+    assert store.write(pd.concat([df, week3]), tmp_path) == [(2025, 2), (2025, 3)]
+    assert store.partitions(tmp_path) == [(2024, 1), (2025, 1), (2025, 2), (2025, 3)]
+
+    got = store.read(tmp_path, seasons=[2025], weeks=range(1, 3), positions=["RB", "K"])
+    assert list(got["player_id"]) == ["c", "d"]
+    assert list(got["fantasy_points_ppr"]) == [7.5, 4.0]
+    assert set(got.columns) == {"player_id", "position", "season", "week", "fantasy_points_ppr"}
+
+
+def test_positions_are_stored_upper_case(tmp_path):
+    store.write(frame([("a", "wr", 2025, 1, 5.0), ("b", "Wr", 2025, 1, 2.0), ("c", "QB", 2025, 1, 1.0)]), tmp_path)
+    got = store.read(tmp_path, positions=["WR"])
+    assert list(got["player_id"]) == ["a", "b"] and set(got["position"]) == {"WR"}
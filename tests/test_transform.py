@@ -0,0 +1,22 @@
+import pandas as pd
+
+from fantasyfootball.features.transform import (
+    clean_teams, clean_scoreboard, build_master, build_top_by_position,
+)
+
+
+def test_clean_and_master():
+    teams = pd.DataFrame({"Team ID": [1, 2], "Wins": [3, 0], "Losses": [1, 0], "Ties": [0, 0]})
+    sb = pd.DataFrame({"Home Score": [100.5], "Away Score": [90.0]})
+    t, s = clean_teams(teams), clean_scoreboard(sb)
+    assert list(teams.columns)[0] == "Team ID"          # input left alone
+    assert t["win_pct"].tolist() == [0.75, 0.0]
+    assert s["total_points"].tolist() == [190.5]
+    master = build_master(t, s)
+    assert master["table"].tolist() == ["teams", "teams", "scoreboard"]
+
+
+def test_top_by_position_sorted_within_position():
+    df = pd.DataFrame({"position": ["WR", "WR", "QB"], "player": ["a", "b", "c"], "ppr_avg": [5.0, 9.0, 1.0]})
+    top = build_top_by_position(df)
+    assert top["player"].tolist() == ["c", "b", "a"]